@@ -8,9 +8,47 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 import traceback
 
+# Optional fast JSON encoder
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+
+def _dumps(obj, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Encode obj as JSON with two-space indentation.
+    
+    Uses orjson when it is installed, which also encodes NumPy arrays and
+    scalars natively; otherwise falls back to the standard library encoder
+    with NumPy values converted through tolist().
+    
+    Args:
+        obj: Object to encode
+        default: Serializer for objects the encoder does not handle itself
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=default,
+                                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY |
+                                       orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; let the standard encoder try
+    
+    def fallback(value):
+        if hasattr(value, 'tolist') and hasattr(value, 'dtype'):  # NumPy arrays and scalars
+            return value.tolist()
+        if default is None:
+            raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+        return default(value)
+    
+    return json.dumps(obj, indent=2, default=fallback)
+
+
 class SimulationLogger:
     """
     Advanced logging system for tank armor simulation.
@@ -99,7 +137,7 @@ class SimulationLogger:
         if extra_data:
             try:
                 clean_data = self._clean_for_json(extra_data)
-                self.logger.debug(f"Debug data: {json.dumps(clean_data, indent=2)}")
+                self.logger.debug(f"Debug data: {_dumps(clean_data)}")
             except Exception as e:
                 self.logger.debug(f"Debug data (serialization error): {str(extra_data)}")
                 self.logger.warning(f"Failed to serialize debug data to JSON: {e}")
@@ -110,7 +148,7 @@ class SimulationLogger:
         if extra_data:
             try:
                 clean_data = self._clean_for_json(extra_data)
-                self.logger.info(f"Info data: {json.dumps(clean_data, indent=2)}")
+                self.logger.info(f"Info data: {_dumps(clean_data)}")
             except Exception as e:
                 self.logger.info(f"Info data (serialization error): {str(extra_data)}")
                 self.logger.warning(f"Failed to serialize info data to JSON: {e}")
@@ -121,7 +159,7 @@ class SimulationLogger:
         if extra_data:
             try:
                 clean_data = self._clean_for_json(extra_data)
-                self.logger.warning(f"Warning data: {json.dumps(clean_data, indent=2)}")
+                self.logger.warning(f"Warning data: {_dumps(clean_data)}")
             except Exception as e:
                 self.logger.warning(f"Warning data (serialization error): {str(extra_data)}")
                 self.logger.warning(f"Failed to serialize warning data to JSON: {e}")
@@ -132,7 +170,7 @@ class SimulationLogger:
         if extra_data:
             try:
                 clean_data = self._clean_for_json(extra_data)
-                self.logger.error(f"Error data: {json.dumps(clean_data, indent=2)}")
+                self.logger.error(f"Error data: {_dumps(clean_data)}")
             except Exception as e:
                 self.logger.error(f"Error data (serialization error): {str(extra_data)}")
                 self.logger.warning(f"Failed to serialize error data to JSON: {e}")
@@ -296,7 +334,7 @@ class SimulationLogger:
         physics_log_file = self.log_dir / f"advanced_physics_{self.session_id}.json"
         try:
             if physics_log_file.exists():
-                with open(physics_log_file, 'r') as f:
+                with open(physics_log_file, 'r', encoding='utf-8') as f:
                     existing_data = json.load(f)
             else:
                 existing_data = {"session_id": self.session_id, "physics_calculations": []}
@@ -313,8 +351,8 @@ class SimulationLogger:
                 else:
                     return str(obj)
             
-            with open(physics_log_file, 'w') as f:
-                json.dump(existing_data, f, indent=2, default=physics_json_serializer)
+            with open(physics_log_file, 'w', encoding='utf-8') as f:
+                f.write(_dumps(existing_data, default=physics_json_serializer))
         except Exception as e:
             self.error(f"Failed to write advanced physics log: {e}")
     
@@ -349,8 +387,8 @@ class SimulationLogger:
                     # Fallback to string representation
                     return str(obj)
             
-            with open(self.session_log_file, 'w') as f:
-                json.dump(self.session_data, f, indent=2, default=json_serializer)
+            with open(self.session_log_file, 'w', encoding='utf-8') as f:
+                f.write(_dumps(self.session_data, default=json_serializer))
         except Exception as e:
             self.logger.error(f"Failed to update session file: {e}")
     
@@ -859,7 +859,8 @@ class Enhanced3DVisualizer:
             else:
                 self._render_failed_penetration(impact_point, analysis.get('effective_thickness_mm', 0.0))
             # Overlay ricochet if present
-            if analysis.get('ricochet') and self.show_ricochet_overlay:
+            if analysis.get('ricochet'):
+                ricochet = dict(gid='ricochet', visible=self.show_ricochet_overlay)
                 rp = analysis.get('ricochet_point') or analysis.get('impact_position_m')
                 rd = analysis.get('ricochet_direction')
                 outcome = str(analysis.get('ricochet_outcome', 'ricochet')).lower()
@@ -870,12 +871,12 @@ class Enhanced3DVisualizer:
                         ex = sx + float(rd['x']) * L
                         ey = sy + float(rd['y']) * L
                         ez = sz + float(rd['z']) * L
-                        self.ax.plot([sx, ex], [sy, ey], [sz, ez], color='yellow', linewidth=3, alpha=0.9, label='Ricochet')
-                        self.ax.scatter([sx], [sy], [sz], c='yellow', s=160, marker='*', edgecolors='black', linewidth=1.5)
+                        self.ax.plot([sx, ex], [sy, ey], [sz, ez], color='yellow', linewidth=3, alpha=0.9, label='Ricochet', **ricochet)
+                        self.ax.scatter([sx], [sy], [sz], c='yellow', s=160, marker='*', edgecolors='black', linewidth=1.5, **ricochet)
                     elif outcome == 'shattering':
-                        self.ax.scatter([sx], [sy], [sz], c='purple', s=200, marker='*', edgecolors='black', linewidth=1.5, label='Shattering')
+                        self.ax.scatter([sx], [sy], [sz], c='purple', s=200, marker='*', edgecolors='black', linewidth=1.5, label='Shattering', **ricochet)
                     elif outcome == 'embedding':
-                        self.ax.scatter([sx], [sy], [sz], c='gray', s=150, marker='D', edgecolors='black', linewidth=1.5, label='Embedding')
+                        self.ax.scatter([sx], [sy], [sz], c='gray', s=150, marker='D', edgecolors='black', linewidth=1.5, label='Embedding', **ricochet)
         except Exception as e:
             self.debug_logger.logger.error(f"Error in impact analysis: {e}")
     
@@ -884,15 +885,20 @@ class Enhanced3DVisualizer:
         """Render multi-part penetration chain if available; else fallback."""
         analysis = self.meta.get('impact_analysis') or {}
         segments = analysis.get('channel_segments') or []
-        if segments and self.show_channel_segments:
+        if segments:
+            # The chain and its spall cone are always drawn, tagged by gid, so that
+            # set_overlay_visibility can toggle them; hidden channels show nothing
+            # (no single-channel fallback)
+            channel = dict(gid='channel', visible=self.show_channel_segments)
+            ricochet = dict(gid='ricochet', visible=self.show_ricochet_overlay)
             for seg in segments:
                 s = seg['start']; e = seg['end']
                 self.ax.plot([s['x'], e['x']], [s['y'], e['y']], [s['z'], e['z']],
-                             color='red', linewidth=6, alpha=0.85, label=None)
+                             color='red', linewidth=6, alpha=0.85, label=None, **channel)
             # Exit marker if overpenetration
-            if analysis.get('overpenetration') and segments and self.show_channel_segments:
+            if analysis.get('overpenetration'):
                 ex = segments[-1]['end']
-                self.ax.scatter([ex['x']], [ex['y']], [ex['z']], c='red', s=120, marker='o', edgecolors='black', linewidth=1.5)
+                self.ax.scatter([ex['x']], [ex['y']], [ex['z']], c='red', s=120, marker='o', edgecolors='black', linewidth=1.5, **channel)
             # Ricochet overlay if ricochet occurred (rare to have both segments and ricochet, but handle)
             if analysis.get('ricochet'):
                 rp = analysis.get('ricochet_point') or analysis.get('impact_position_m')
@@ -903,13 +909,13 @@ class Enhanced3DVisualizer:
                     exx = sx + float(rd['x']) * L
                     eyy = sy + float(rd['y']) * L
                     ezz = sz + float(rd['z']) * L
-                    self.ax.plot([sx, exx], [sy, eyy], [sz, ezz], color='yellow', linewidth=3, alpha=0.9, label='Ricochet')
-                    self.ax.scatter([sx], [sy], [sz], c='yellow', s=160, marker='*', edgecolors='black', linewidth=1.5)
+                    self.ax.plot([sx, exx], [sy, eyy], [sz, ezz], color='yellow', linewidth=3, alpha=0.9, label='Ricochet', **ricochet)
+                    self.ax.scatter([sx], [sy], [sz], c='yellow', s=160, marker='*', edgecolors='black', linewidth=1.5, **ricochet)
             # Spall at first passed segment end (approximate)
             if getattr(ammunition, 'penetration_type', 'kinetic') == 'kinetic' and segments:
                 first_end = segments[0]['end']
                 length_m = math.sqrt((segments[0]['end']['x']-segments[0]['start']['x'])**2 + (segments[0]['end']['y']-segments[0]['start']['y'])**2 + (segments[0]['end']['z']-segments[0]['start']['z'])**2)
-                self._create_spall_cone_visualization(first_end['x'], first_end['y'], first_end['z'], max(0.1, length_m*0.3))
+                self._create_spall_cone_visualization(first_end['x'], first_end['y'], first_end['z'], max(0.1, length_m*0.3), **channel)
             return
         # Fallback single channel if no chain
         channel_depth = min(penetration / 1000, 2.0)
@@ -943,7 +949,8 @@ class Enhanced3DVisualizer:
                     label='Impact Crater')
     
     def _create_spall_cone_visualization(self, apex_x: float, apex_y: float, apex_z: float,
-                                       penetration_depth: float):
+                                       penetration_depth: float, gid: Optional[str] = None,
+                                       visible: bool = True):
         """Create spall cone for behind-armor effects."""
         
         cone_angle = math.radians(30)  # 30-degree spall cone
@@ -959,7 +966,7 @@ class Enhanced3DVisualizer:
         # Draw cone wireframe
         for i, angle in enumerate(angles):
             self.ax.plot([apex_x, base_x[i]], [apex_y, base_y[i]], [apex_z, base_z[i]],
-                        color='orange', linewidth=2, alpha=0.6)
+                        color='orange', linewidth=2, alpha=0.6, gid=gid, visible=visible)
     
     def _add_interactive_controls(self):
         """Add interactive controls for 3D visualization."""
@@ -1036,7 +1043,7 @@ class Enhanced3DVisualizer:
                       bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
         
         # Add legend
-        self.ax.legend(loc='upper right', bbox_to_anchor=(1.0, 0.85))
+        self._update_legend()
         
         # Set title
         self.fig.suptitle('Enhanced 3D Tank Armor Penetration Analysis', 
@@ -1111,6 +1118,43 @@ class Enhanced3DVisualizer:
         else:
             self.debug_logger.logger.error("No visualization to save.")
 
+    def reset(self):
+        """Close the current figure and clear per-visualization state so the visualizer can be reused."""
+        if self.fig is not None:
+            plt.close(self.fig)
+        self.fig = None
+        self.ax = None
+        self.trajectory_points = []
+        self.tank_model = {}
+        self.animation = None
+        self.collision_info = None
+        self.meta = {key: None for key in self.meta}
+
+    def set_overlay_visibility(self, channels: Optional[bool] = None, ricochet: Optional[bool] = None):
+        """Show or hide the channel and ricochet overlays already drawn on the current axes."""
+        if channels is not None:
+            self.show_channel_segments = bool(channels)
+        if ricochet is not None:
+            self.show_ricochet_overlay = bool(ricochet)
+        if self.ax is None:
+            return
+        visible = {'channel': self.show_channel_segments, 'ricochet': self.show_ricochet_overlay}
+        for artist in [*self.ax.lines, *self.ax.collections]:
+            gid = artist.get_gid()
+            if gid in visible:
+                artist.set_visible(visible[gid])
+        if self.ax.get_legend() is not None:
+            self._update_legend()
+        self.fig.canvas.draw_idle()
+    
+    def _update_legend(self):
+        """(Re)build the legend from the labelled artists that are currently visible."""
+        shown = [(handle, label) for handle, label in zip(*self.ax.get_legend_handles_labels())
+                 if handle.get_visible()]
+        legend = self.ax.legend([handle for handle, _ in shown], [label for _, label in shown],
+                                loc='upper right', bbox_to_anchor=(1.0, 0.85))
+        legend.set_visible(bool(shown))
+
     # ---------- Collision and AABB helpers ----------
     def _get_tank_aabbs(self, x_center: float) -> List[Dict[str, Any]]:
         parts = []
@@ -1701,7 +1745,8 @@ class Enhanced3DVisualizer:
                 else:
                     self._render_failed_penetration(impact_point, impact.get('effective_thickness_mm', 0.0))
                 # Ricochet overlay if present
-                if impact.get('ricochet') and self.show_ricochet_overlay:
+                if impact.get('ricochet'):
+                    ricochet = dict(gid='ricochet', visible=self.show_ricochet_overlay)
                     rp = impact.get('ricochet_point') or impact.get('impact_position_m')
                     rd = impact.get('ricochet_direction')
                     outcome = str(impact.get('ricochet_outcome', 'ricochet')).lower()
@@ -1713,12 +1758,12 @@ class Enhanced3DVisualizer:
                             ex = sx + float(rd['x']) * L
                             ey = sy + float(rd['y']) * L
                             ez = sz + float(rd['z']) * L
-                            self.ax.plot([sx, ex], [sy, ey], [sz, ez], color='yellow', linewidth=3, alpha=0.9, label='Ricochet')
-                            self.ax.scatter([sx], [sy], [sz], c='yellow', s=160, marker='*', edgecolors='black', linewidth=1.5)
+                            self.ax.plot([sx, ex], [sy, ey], [sz, ez], color='yellow', linewidth=3, alpha=0.9, label='Ricochet', **ricochet)
+                            self.ax.scatter([sx], [sy], [sz], c='yellow', s=160, marker='*', edgecolors='black', linewidth=1.5, **ricochet)
                         elif outcome == 'shattering':
-                            self.ax.scatter([sx], [sy], [sz], c='purple', s=200, marker='*', edgecolors='black', linewidth=1.5, label='Shattering')
+                            self.ax.scatter([sx], [sy], [sz], c='purple', s=200, marker='*', edgecolors='black', linewidth=1.5, label='Shattering', **ricochet)
                         elif outcome == 'embedding':
-                            self.ax.scatter([sx], [sy], [sz], c='gray', s=150, marker='D', edgecolors='black', linewidth=1.5, label='Embedding')
+                            self.ax.scatter([sx], [sy], [sz], c='gray', s=150, marker='D', edgecolors='black', linewidth=1.5, label='Embedding', **ricochet)
         except Exception as e:
             self.debug_logger.logger.warning(f"Could not render analysis from dataset: {e}")
         self.fig.suptitle('Interactive Result Viewer', fontsize=14, fontweight='bold')
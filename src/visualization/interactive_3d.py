@@ -12,13 +12,124 @@ This module provides comprehensive 3D visualization capabilities including:
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from mpl_toolkits.mplot3d.art3d import Poly3DCollection, Line3DCollection
+from matplotlib.colors import Normalize
 import matplotlib.patches as patches
 from matplotlib.widgets import Slider, Button
 import matplotlib.animation as animation
 from typing import List, Dict, Tuple, Optional, Any
+import functools
 import math
 
+from .numba_kernels import (ring as _ring_kernel, channel as _channel_kernel,
+                            wind_field as _wind_field_kernel, _HAS_NUMBA)
+
+
+def _trajectory_acceleration(vel: np.ndarray, drag_k: np.ndarray, wind: np.ndarray,
+                             g: float) -> np.ndarray:
+    """Projectile acceleration for a (B, 3) batch of velocities."""
+    
+    speed = np.sqrt(np.einsum('ij,ij->i', vel, vel))
+    acc = -(drag_k * speed)[:, None] * vel
+    acc[:, :2] += (wind[:, :2] - vel[:, :2]) * 0.001  # Wind resistance
+    acc[:, 2] -= g
+    return acc
+
+
+# Geometry vertex dtype: float32 halves the bytes pushed through the 3D projection
+_FDTYPE = np.float32
+
+
+@functools.lru_cache(maxsize=None)
+def _ring_trig(n_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Cached (cos, sin) of n_points ring angles spanning 0..2*pi inclusive."""
+    
+    angles = np.linspace(0, 2*np.pi, n_points)
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    cos_a.setflags(write=False)
+    sin_a.setflags(write=False)
+    return cos_a, sin_a
+
+
+def _closed_cylinder_faces(n_sides: int) -> np.ndarray:
+    """
+    Quad face indices for a closed cylinder.
+    
+    Vertices are laid out as n_sides bottom-ring points, n_sides top-ring
+    points, then the bottom and top ring centroids. Side faces are quads and
+    the caps are triangle fans padded to four indices by repeating the last
+    vertex, so the whole mesh packs into one (3 * n_sides, 4) array.
+    """
+    
+    ring = np.arange(n_sides)
+    ring_next = np.roll(ring, -1)
+    bottom_center = np.full(n_sides, 2 * n_sides)
+    top_center = np.full(n_sides, 2 * n_sides + 1)
+    
+    sides = np.stack([ring, ring_next, ring_next + n_sides, ring + n_sides], axis=1)
+    bottom_cap = np.stack([bottom_center, ring_next, ring, ring], axis=1)
+    top_cap = np.stack([top_center, ring + n_sides, ring_next + n_sides, ring_next + n_sides], axis=1)
+    
+    return np.vstack([sides, bottom_cap, top_cap]).astype(np.int32)
+
+
+def _halton(n_points: int, n_dims: int) -> np.ndarray:
+    """First n_points of the Halton low-discrepancy sequence in [0, 1)^n_dims."""
+    
+    out = np.zeros((n_points, n_dims))
+    for dim, base in enumerate((2, 3, 5, 7, 11, 13)[:n_dims]):
+        index = np.arange(1, n_points + 1)
+        scale = 1.0
+        while index.any():
+            scale /= base
+            out[:, dim] += scale * (index % base)
+            index //= base
+    return out
+
+
+# Fixed scatter pattern for fragments and debris, so effect geometry is a pure
+# function of the impact point and redraws can reuse cached results
+_HALTON_OFFSETS = _halton(20, 3)
+_HALTON_OFFSETS.setflags(write=False)
+
+
+def _scatter_points(impact_point: List[float], n_points: int,
+                    low: Tuple[float, float, float],
+                    high: Tuple[float, float, float]) -> np.ndarray:
+    """(n_points, 3) points offset from impact_point within [low, high) per axis."""
+    
+    low = np.asarray(low)
+    offsets = low + (np.asarray(high) - low) * _HALTON_OFFSETS[:n_points]
+    return (np.asarray(impact_point) + offsets).astype(_FDTYPE)
+
+
+# Behind-armor effects kept per visualizer, keyed by rounded impact point
+_EFFECTS_CACHE_SIZE = 128
+
+
+# Wind grids above this many points use the JIT kernel when Numba is available;
+# smaller grids stay on NumPy to avoid the first-call compile cost
+_WIND_JIT_MIN_POINTS = 10_000
+
+
+# Dry air gas constant (J/(kg*K)) times ISA sea-level temperature (K)
+_AIR_GAS_DENOM = 287.05 * 288.15
+
+
+# Static tank geometry shared by every visualizer, keyed by tank type
+_TANK_MODEL_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def _freeze_arrays(node: Any) -> Any:
+    """Recursively mark every ndarray in a nested model as read-only."""
+    
+    if isinstance(node, np.ndarray):
+        node.setflags(write=False)
+    elif isinstance(node, dict):
+        for value in node.values():
+            _freeze_arrays(value)
+    return node
+
 
 class Interactive3DVisualizer:
     """
@@ -31,6 +142,7 @@ class Interactive3DVisualizer:
         self.fig = None
         self.ax = None
         self.tank_model = None
+        self._effects_cache = {}
         self.projectile_path = None
         self.environmental_effects = None
         
@@ -47,9 +159,21 @@ class Interactive3DVisualizer:
             tank_type: Type of tank to model (modern_mbt, historical, etc.)
             
         Returns:
-            Dictionary containing tank model geometry and armor data
+            Dictionary containing tank model geometry and armor data.
+            The geometry is static per tank type, so the model is built once
+            and shared; its vertex arrays are read-only.
         """
         
+        tank_model = _TANK_MODEL_CACHE.get(tank_type)
+        if tank_model is None:
+            tank_model = _freeze_arrays(self._build_tank_model(tank_type))
+            _TANK_MODEL_CACHE[tank_type] = tank_model
+        
+        return tank_model
+    
+    def _build_tank_model(self, tank_type: str) -> Dict[str, Any]:
+        """Build the tank model geometry for a tank type from scratch."""
+        
         if tank_type == "modern_mbt":
             # Modern MBT dimensions (based on M1A2/Leopard 2 style)
             tank_model = {
@@ -85,10 +209,10 @@ class Interactive3DVisualizer:
             
             # Side connection points for slope
             [length/2-0.5, -width/2, 0], [length/2-0.5, width/2, 0],
-        ])
+        ], dtype=_FDTYPE)
         
-        # Define faces for hull
-        faces = [
+        # Define faces for hull as one (F, 4) index array; every face is a quad
+        faces = np.array([
             # Bottom
             [0, 1, 9, 8], [1, 5, 4, 9], [8, 9, 4, 0],
             # Top  
@@ -99,11 +223,14 @@ class Interactive3DVisualizer:
             [0, 3, 2, 1],
             # Front (sloped)
             [4, 5, 6, 7]
-        ]
+        ], dtype=np.int32)
         
+        # 'polys' is the (F, 4, 3) batch Poly3DCollection draws in one call;
+        # renderers should prefer it over gathering vertices per face
         return {
             'vertices': vertices,
             'faces': faces,
+            'polys': vertices[faces],
             'armor_thickness': {
                 'front': 650,  # mm RHA equivalent
                 'side': 300,
@@ -122,33 +249,29 @@ class Interactive3DVisualizer:
         radius_base, radius_top = 1.6, 1.4
         height = 1.2
         
-        # Create turret vertices (simplified cylindrical)
-        angles = np.linspace(0, 2*np.pi, 16)
-        
-        # Bottom ring
-        bottom_verts = np.array([[turret_center[0] + radius_base * np.cos(angle),
-                                turret_center[1] + radius_base * np.sin(angle),
-                                turret_center[2]] for angle in angles])
-        
-        # Top ring  
-        top_verts = np.array([[turret_center[0] + radius_top * np.cos(angle),
-                             turret_center[1] + radius_top * np.sin(angle),
-                             turret_center[2] + height] for angle in angles])
-        
-        vertices = np.vstack([bottom_verts, top_verts])
-        
-        # Create cylindrical faces
-        faces = []
-        n_sides = len(angles)
-        
-        # Side faces
-        for i in range(n_sides):
-            next_i = (i + 1) % n_sides
-            faces.append([i, next_i, next_i + n_sides, i + n_sides])
+        # Create turret vertices (simplified cylindrical) directly in one
+        # (2n + 2, 3) array: bottom ring, top ring, then the ring centroids
+        cos_a, sin_a = _ring_trig(16)
+        n_sides = len(cos_a)
+        vertices = np.empty((2 * n_sides + 2, 3), dtype=_FDTYPE)
+        vertices[:n_sides, 0] = turret_center[0] + radius_base * cos_a
+        vertices[:n_sides, 1] = turret_center[1] + radius_base * sin_a
+        vertices[:n_sides, 2] = turret_center[2]
+        vertices[n_sides:2*n_sides, 0] = turret_center[0] + radius_top * cos_a
+        vertices[n_sides:2*n_sides, 1] = turret_center[1] + radius_top * sin_a
+        vertices[n_sides:2*n_sides, 2] = turret_center[2] + height
+        
+        # Ring centroids close the cylinder with bottom and top caps
+        vertices[2*n_sides] = turret_center
+        vertices[2*n_sides + 1] = [turret_center[0], turret_center[1], turret_center[2] + height]
+        
+        # Create closed cylindrical faces (sides plus cap fans)
+        faces = _closed_cylinder_faces(n_sides)
         
         return {
             'vertices': vertices,
             'faces': faces,
+            'polys': vertices[faces],
             'armor_thickness': {
                 'front': 800,  # mm RHA equivalent
                 'side': 400,
@@ -169,36 +292,34 @@ class Interactive3DVisualizer:
         
         # Gun barrel as cylinder
         gun_end = [
-            gun_base[0] + gun_length * np.cos(np.radians(elevation_angle)),
+            gun_base[0] + gun_length * math.cos(math.radians(elevation_angle)),
             gun_base[1], 
-            gun_base[2] + gun_length * np.sin(np.radians(elevation_angle))
+            gun_base[2] + gun_length * math.sin(math.radians(elevation_angle))
         ]
         
-        # Create cylindrical gun barrel
-        angles = np.linspace(0, 2*np.pi, 12)
-        
-        base_verts = np.array([[gun_base[0], 
-                              gun_base[1] + gun_diameter/2 * np.cos(angle),
-                              gun_base[2] + gun_diameter/2 * np.sin(angle)] 
-                             for angle in angles])
-        
-        end_verts = np.array([[gun_end[0],
-                             gun_end[1] + gun_diameter/2 * np.cos(angle), 
-                             gun_end[2] + gun_diameter/2 * np.sin(angle)]
-                            for angle in angles])
-        
-        vertices = np.vstack([base_verts, end_verts])
-        
-        # Create faces
-        faces = []
-        n_sides = len(angles)
-        for i in range(n_sides):
-            next_i = (i + 1) % n_sides
-            faces.append([i, next_i, next_i + n_sides, i + n_sides])
+        # Create cylindrical gun barrel directly in one (2n + 2, 3) array:
+        # breech ring, muzzle ring, then the ring centroids
+        cos_a, sin_a = _ring_trig(12)
+        n_sides = len(cos_a)
+        vertices = np.empty((2 * n_sides + 2, 3), dtype=_FDTYPE)
+        vertices[:n_sides, 0] = gun_base[0]
+        vertices[:n_sides, 1] = gun_base[1] + gun_diameter/2 * cos_a
+        vertices[:n_sides, 2] = gun_base[2] + gun_diameter/2 * sin_a
+        vertices[n_sides:2*n_sides, 0] = gun_end[0]
+        vertices[n_sides:2*n_sides, 1] = gun_end[1] + gun_diameter/2 * cos_a
+        vertices[n_sides:2*n_sides, 2] = gun_end[2] + gun_diameter/2 * sin_a
+        
+        # Ring centroids close the barrel at breech and muzzle
+        vertices[2*n_sides] = gun_base
+        vertices[2*n_sides + 1] = gun_end
+        
+        # Create closed barrel faces (sides plus cap fans)
+        faces = _closed_cylinder_faces(n_sides)
         
         return {
             'vertices': vertices,
             'faces': faces,
+            'polys': vertices[faces],
             'muzzle_position': gun_end,
             'bore_diameter': gun_diameter
         }
@@ -218,7 +339,7 @@ class Interactive3DVisualizer:
                 [track_length/2, -2.0 + track_width, 0], [-track_length/2, -2.0 + track_width, 0],
                 [-track_length/2, -2.0, track_height], [track_length/2, -2.0, track_height],
                 [track_length/2, -2.0 + track_width, track_height], [-track_length/2, -2.0 + track_width, track_height]
-            ]),
+            ], dtype=_FDTYPE),
             'faces': [
                 [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7],  # Sides
                 [0, 1, 2, 3], [4, 5, 6, 7]  # Top and bottom
@@ -232,7 +353,7 @@ class Interactive3DVisualizer:
                 [track_length/2, 2.0, 0], [-track_length/2, 2.0, 0],
                 [-track_length/2, 2.0 - track_width, track_height], [track_length/2, 2.0 - track_width, track_height],
                 [track_length/2, 2.0, track_height], [-track_length/2, 2.0, track_height]
-            ]),
+            ], dtype=_FDTYPE),
             'faces': [
                 [0, 1, 5, 4], [1, 2, 6, 5], [2, 3, 7, 6], [3, 0, 4, 7],
                 [0, 1, 2, 3], [4, 5, 6, 7]
@@ -279,102 +400,192 @@ class Interactive3DVisualizer:
             environmental_conditions: Environmental parameters
             
         Returns:
-            Dictionary containing 3D trajectory data and environmental effects
+            Dictionary containing 3D trajectory data and environmental effects.
+            Per-step data is stored as arrays: 'positions' and 'velocities'
+            (N, 3), and 'speeds', 'times', 'drag_effects', 'wind_effects' (N,).
+            'positions_xyz' is a contiguous float32 copy of 'positions' ready
+            for plotting, and 'speeds' is float32 for colormapping.
         """
         
-        # Enhanced 3D trajectory calculation
-        g = 9.81  # gravity
-        dt = 0.01  # time step
+        return self.create_3d_trajectories(
+            [ammunition], [target_range], [launch_angle], environmental_conditions
+        )[0]
+    
+    def create_3d_trajectories(self, ammunitions, ranges, launch_angles,
+                             environmental_conditions: Optional[Dict] = None) -> List[Dict[str, Any]]:
+        """
+        Calculate a batch of 3D ballistic trajectories integrated in lockstep.
         
-        # Initial conditions
-        v0 = ammunition.muzzle_velocity
-        angle_rad = np.radians(launch_angle)
+        Args:
+            ammunitions: Ammunition object or sequence of ammunition objects
+            ranges: Target distance(s) in meters
+            launch_angles: Launch elevation angle(s) in degrees
+            environmental_conditions: Environmental parameters; each value may be
+                a scalar or a per-shot sequence
+            
+        Returns:
+            List with one trajectory dictionary per shot, in the same format
+            as create_3d_trajectory
+        """
         
-        # Environmental effects
-        if environmental_conditions:
-            wind_speed = environmental_conditions.get('wind_speed', 0)
-            wind_direction = environmental_conditions.get('wind_direction', 0)  # degrees
-            temperature = environmental_conditions.get('temperature', 15)
-            altitude = environmental_conditions.get('altitude', 0)
-            humidity = environmental_conditions.get('humidity', 50)
-        else:
-            wind_speed = 0
-            wind_direction = 0
-            temperature = 15
-            altitude = 0
-            humidity = 50
+        # Enhanced 3D trajectory calculation
+        g = 9.81  # gravity
+        dt = 0.05  # time step (RK4 keeps the 0.01 s Euler accuracy at 5x the step)
+        
+        if not isinstance(ammunitions, (list, tuple)):
+            ammunitions = [ammunitions]
+        environmental_conditions = environmental_conditions or {}
+        
+        # Broadcast every launch condition to one entry per shot
+        (v0, mass, diameter_mm, target_range, launch_angle, wind_speed, wind_direction,
+         temperature, altitude) = np.broadcast_arrays(
+            np.array([ammo.muzzle_velocity for ammo in ammunitions], dtype=float),
+            np.array([ammo.mass for ammo in ammunitions], dtype=float),
+            np.array([getattr(ammo, 'penetrator_diameter', ammo.caliber) for ammo in ammunitions],
+                     dtype=float),
+            np.asarray(ranges, dtype=float),
+            np.asarray(launch_angles, dtype=float),
+            np.asarray(environmental_conditions.get('wind_speed', 0), dtype=float),
+            np.asarray(environmental_conditions.get('wind_direction', 0), dtype=float),  # degrees
+            np.asarray(environmental_conditions.get('temperature', 15), dtype=float),
+            np.asarray(environmental_conditions.get('altitude', 0), dtype=float),
+        )
+        batch = v0.shape[0]
         
         # Air density adjustment for altitude and temperature
         air_density_factor = (1 - 0.0065 * altitude / 288.15) * (288.15 / (temperature + 273.15))
         
-        # Drag coefficient (simplified)
+        # Drag coefficient (simplified), folded into a per-unit-mass drag constant
+        # k = 0.5 * rho * Cd * A / m so the drag deceleration is k * |v| * v
         Cd = 0.15 * air_density_factor
+        reference_area = np.pi * (diameter_mm / 2000) ** 2
+        drag_k = 0.5 * 1.225 * Cd * reference_area / mass
         
-        # Initialize trajectory arrays
-        trajectory_points = []
-        
-        # Initial velocity components
-        vx = v0 * np.cos(angle_rad)
-        vy = 0  # No initial lateral velocity
-        vz = v0 * np.sin(angle_rad)
-        
-        # Position
-        x, y, z = 0, 0, 2.5  # Start at gun height
-        t = 0
+        # Initial state: start at gun height, no initial lateral velocity
+        angle_rad = np.radians(launch_angle)
+        pos = np.zeros((batch, 3))
+        pos[:, 2] = 2.5
+        vel = np.zeros((batch, 3))
+        vel[:, 0] = v0 * np.cos(angle_rad)
+        vel[:, 2] = v0 * np.sin(angle_rad)
+        start_pos, start_vel = pos, vel
         
         # Wind effect components
-        wind_x = wind_speed * np.cos(np.radians(wind_direction))
-        wind_y = wind_speed * np.sin(np.radians(wind_direction))
-        
-        while z >= 0 and x <= target_range * 1.5:  # Continue until ground impact or max range
+        wind = np.zeros((batch, 3))
+        wind[:, 0] = wind_speed * np.cos(np.radians(wind_direction))
+        wind[:, 1] = wind_speed * np.sin(np.radians(wind_direction))
+        
+        max_x = target_range * 1.5
+        steps = np.zeros(batch, dtype=int)
+        
+        # Preallocated step buffers, sized from the slowest downrange shot
+        n_max = int(np.max(max_x / np.maximum(vel[:, 0] * dt, 1e-3))) + 256
+        position_buffer = np.empty((n_max, batch, 3))
+        velocity_buffer = np.empty((n_max, batch, 3))
+        
+        # Continue each shot until ground impact or max range
+        i = 0
+        alive = (pos[:, 2] >= 0) & (pos[:, 0] <= max_x)
+        while alive.any():
             
-            # Current velocity magnitude
-            v_mag = np.sqrt(vx**2 + vy**2 + vz**2)
+            # Classical RK4 step; acceleration depends on velocity only
+            a1 = _trajectory_acceleration(vel, drag_k, wind, g)
+            v2 = vel + 0.5 * dt * a1
+            a2 = _trajectory_acceleration(v2, drag_k, wind, g)
+            v3 = vel + 0.5 * dt * a2
+            a3 = _trajectory_acceleration(v3, drag_k, wind, g)
+            v4 = vel + dt * a3
+            a4 = _trajectory_acceleration(v4, drag_k, wind, g)
             
-            # Drag force components
-            if v_mag > 0:
-                drag_factor = Cd * v_mag
-                drag_x = -drag_factor * vx
-                drag_y = -drag_factor * vy  
-                drag_z = -drag_factor * vz
-            else:
-                drag_x = drag_y = drag_z = 0
+            # Finished shots keep their final state
+            step_mask = alive[:, None]
+            pos = np.where(step_mask, pos + dt / 6 * (vel + 2 * v2 + 2 * v3 + v4), pos)
+            vel = np.where(step_mask, vel + dt / 6 * (a1 + 2 * a2 + 2 * a3 + a4), vel)
+            steps += alive
             
-            # Wind effects (simplified)
-            wind_effect_x = (wind_x - vx) * 0.001  # Wind resistance
-            wind_effect_y = (wind_y - vy) * 0.001
+            # Drag slows shots below the sizing estimate; grow rather than overrun
+            if i == n_max:
+                position_buffer = np.concatenate([position_buffer, np.empty_like(position_buffer)])
+                velocity_buffer = np.concatenate([velocity_buffer, np.empty_like(velocity_buffer)])
+                n_max *= 2
+            position_buffer[i] = pos
+            velocity_buffer[i] = vel
+            i += 1
+            alive &= (pos[:, 2] >= 0) & (pos[:, 0] <= max_x)
+        
+        # Ground impact: replace each grounded shot's final step with the exact
+        # z = 0 crossing, interpolated linearly from the step before it
+        grounded = np.flatnonzero((steps > 0) & (pos[:, 2] < 0))
+        last = steps[grounded] - 1
+        prev_pos = np.where((last > 0)[:, None], position_buffer[last - 1, grounded], start_pos[grounded])
+        prev_vel = np.where((last > 0)[:, None], velocity_buffer[last - 1, grounded], start_vel[grounded])
+        fraction = prev_pos[:, 2] / (prev_pos[:, 2] - position_buffer[last, grounded, 2])
+        position_buffer[last, grounded] = prev_pos + fraction[:, None] * (position_buffer[last, grounded] - prev_pos)
+        velocity_buffer[last, grounded] = prev_vel + fraction[:, None] * (velocity_buffer[last, grounded] - prev_vel)
+        position_buffer[last, grounded, 2] = 0.0
+        
+        # Per-point force breakdown, evaluated for the whole batch at once
+        velocities = velocity_buffer[:i]
+        speeds = np.linalg.norm(velocities, axis=2)
+        drag_effects = drag_k * speeds**2
+        wind_effects = np.linalg.norm((wind[:, :2] - velocities[:, :, :2]) * 0.001, axis=2)
+        times = np.tile(dt * np.arange(1, i + 1)[:, None], (1, batch))
+        times[last, grounded] -= (1 - fraction) * dt
+        
+        results = []
+        for shot in range(batch):
+            n = steps[shot]
+            positions = position_buffer[:n, shot]
+            impact_velocity = speeds[n - 1, shot] if n else v0[shot]
             
-            # Update velocities
-            vx += (drag_x + wind_effect_x) * dt
-            vy += (drag_y + wind_effect_y) * dt
-            vz += (-g + drag_z) * dt
-            
-            # Update position
-            x += vx * dt
-            y += vy * dt
-            z += vz * dt
-            t += dt
-            
-            # Store point with additional data
-            trajectory_points.append({
-                'position': [x, y, z],
-                'velocity': [vx, vy, vz],
-                'speed': v_mag,
-                'time': t,
-                'drag_effect': np.sqrt(drag_x**2 + drag_y**2 + drag_z**2),
-                'wind_effect': np.sqrt(wind_effect_x**2 + wind_effect_y**2)
+            results.append({
+                'positions': positions,
+                'positions_xyz': np.ascontiguousarray(positions, dtype=np.float32),
+                'velocities': velocities[:n, shot],
+                'speeds': speeds[:n, shot].astype(np.float32),
+                'times': times[:n, shot],
+                'drag_effects': drag_effects[:n, shot],
+                'wind_effects': wind_effects[:n, shot],
+                'environmental_effects': {
+                    'air_density_factor': air_density_factor[shot],
+                    'total_wind_deflection': positions[-1, 1] if n else 0,
+                    'flight_time': times[n - 1, shot] if n else 0.0,
+                    'impact_velocity': impact_velocity,
+                    'drag_losses': v0[shot] - impact_velocity
+                }
             })
         
-        return {
-            'trajectory_points': trajectory_points,
-            'environmental_effects': {
-                'air_density_factor': air_density_factor,
-                'total_wind_deflection': trajectory_points[-1]['position'][1] if trajectory_points else 0,
-                'flight_time': t,
-                'impact_velocity': v_mag,
-                'drag_losses': v0 - v_mag
-            }
-        }
+        return results
+    
+    def plot_trajectory(self, trajectory: Dict[str, Any], ax, color_by_speed: bool = False,
+                        **kwargs):
+        """
+        Draw a trajectory from create_3d_trajectory onto a 3D axis.
+        
+        Args:
+            trajectory: Trajectory dictionary with 'positions_xyz' and 'speeds'
+            ax: Matplotlib 3D axis
+            color_by_speed: Color each segment by speed (plasma colormap)
+                instead of drawing a single line
+            **kwargs: Extra styling passed to the line or collection
+            
+        Returns:
+            The Line3D or Line3DCollection artist added to the axis
+        """
+        
+        positions = trajectory['positions_xyz']
+        if not color_by_speed:
+            return ax.plot(*positions.T, **kwargs)[0]
+        
+        # One collection for all segments, colored by the speed at each segment start
+        speeds = trajectory['speeds']
+        segments = np.stack([positions[:-1], positions[1:]], axis=1)
+        collection = Line3DCollection(segments, cmap='plasma',
+                                      norm=Normalize(0, speeds.max() if len(speeds) else 1),
+                                      **kwargs)
+        collection.set_array(speeds[:-1])
+        ax.add_collection3d(collection)
+        return collection
     
     def create_3d_penetration_analysis(self, ammunition, armor, impact_point: List[float],
                                      impact_angle: float) -> Dict[str, Any]:
@@ -462,122 +673,85 @@ class Interactive3DVisualizer:
         
         return channel_data
     
-    def _create_kinetic_penetration_channel(self, impact_point: List[float],
-                                          impact_angle: float, penetration_depth: float) -> Dict:
-        """Create kinetic penetrator channel geometry."""
+    def _build_channel(self, impact_point: List[float], impact_angle: float,
+                       length_mm: float, r_entry: float, r_exit: Optional[float],
+                       n_sides: int, channel_type: str) -> Dict:
+        """
+        Build penetration channel geometry shared by every ammunition type.
         
-        # APFSDS penetrator parameters
-        penetrator_diameter = 0.022  # 22mm typical
-        channel_length = penetration_depth / 1000  # Convert mm to meters
-        
-        # Create cylindrical penetration channel
-        angles = np.linspace(0, 2*np.pi, 12)
-        
-        # Entry point
-        entry_verts = []
-        for angle in angles:
-            x_offset = penetrator_diameter/2 * np.cos(angle)
-            y_offset = penetrator_diameter/2 * np.sin(angle)
-            entry_verts.append([
-                impact_point[0] + x_offset,
-                impact_point[1] + y_offset, 
-                impact_point[2]
-            ])
-        
-        # Exit point (if penetrating)
-        exit_verts = []
-        penetration_vector = [
-            -channel_length * np.cos(np.radians(impact_angle)),
-            0,
-            -channel_length * np.sin(np.radians(impact_angle))
-        ]
+        Args:
+            impact_point: 3D coordinates of impact [x, y, z]
+            impact_angle: Impact angle in degrees
+            length_mm: Channel length (penetration depth) in mm
+            r_entry: Entry ring radius in meters
+            r_exit: Exit ring radius in meters, or None for an entry ring only
+            n_sides: Number of vertices per ring
+            channel_type: Channel type label stored with the geometry
+            
+        Returns:
+            Dictionary with 'entry_vertices', 'penetration_vector',
+            'channel_type' and, when r_exit is given, 'exit_vertices'
+        """
         
-        for angle in angles:
-            x_offset = penetrator_diameter/2 * np.cos(angle) * 1.2  # Slight expansion
-            y_offset = penetrator_diameter/2 * np.sin(angle) * 1.2
-            exit_verts.append([
-                impact_point[0] + penetration_vector[0] + x_offset,
-                impact_point[1] + penetration_vector[1] + y_offset,
-                impact_point[2] + penetration_vector[2]
-            ])
+        channel_length = length_mm / 1000  # Convert mm to meters
+        angle_rad = math.radians(impact_angle)
+        center = np.asarray(impact_point, dtype=float)
+        cos_a, sin_a = _ring_trig(n_sides)
         
-        return {
-            'entry_vertices': np.array(entry_verts),
-            'exit_vertices': np.array(exit_verts),
-            'channel_type': 'kinetic',
-            'penetrator_fragments': self._create_penetrator_fragments(impact_point, penetration_vector)
+        channel_data = {
+            'penetration_vector': [
+                -channel_length * math.cos(angle_rad),
+                0,
+                -channel_length * math.sin(angle_rad)
+            ],
+            'channel_type': channel_type
         }
+        
+        if r_exit is None:
+            channel_data['entry_vertices'] = _ring_kernel(center, r_entry, cos_a, sin_a)
+        else:
+            channel_data['entry_vertices'], channel_data['exit_vertices'] = _channel_kernel(
+                center, angle_rad, channel_length, r_entry, r_exit, cos_a, sin_a
+            )
+        
+        return channel_data
+    
+    def _create_kinetic_penetration_channel(self, impact_point: List[float],
+                                          impact_angle: float, penetration_depth: float) -> Dict:
+        """Create kinetic penetrator channel geometry."""
+        
+        # APFSDS penetrator parameters: 22mm typical, exit ring slightly expanded
+        penetrator_diameter = 0.022
+        channel_data = self._build_channel(impact_point, impact_angle, penetration_depth,
+                                           penetrator_diameter/2, penetrator_diameter/2 * 1.2,
+                                           12, 'kinetic')
+        channel_data['penetrator_fragments'] = self._create_penetrator_fragments(
+            impact_point, channel_data['penetration_vector']
+        )
+        return channel_data
     
     def _create_heat_penetration_channel(self, impact_point: List[float],
                                        impact_angle: float, penetration_depth: float) -> Dict:
         """Create HEAT jet penetration channel geometry."""
         
-        # HEAT jet parameters
-        jet_diameter_entry = 0.006  # 6mm entry
-        jet_diameter_exit = 0.020   # 20mm exit (expansion)
-        channel_length = penetration_depth / 1000
-        
-        # Create conical penetration channel
-        angles = np.linspace(0, 2*np.pi, 12)
-        
-        # Entry (small diameter)
-        entry_verts = []
-        for angle in angles:
-            x_offset = jet_diameter_entry/2 * np.cos(angle)
-            y_offset = jet_diameter_entry/2 * np.sin(angle)
-            entry_verts.append([
-                impact_point[0] + x_offset,
-                impact_point[1] + y_offset,
-                impact_point[2]
-            ])
-        
-        # Exit (larger diameter)
-        exit_verts = []
-        penetration_vector = [
-            -channel_length * np.cos(np.radians(impact_angle)),
-            0,
-            -channel_length * np.sin(np.radians(impact_angle))
-        ]
-        
-        for angle in angles:
-            x_offset = jet_diameter_exit/2 * np.cos(angle)
-            y_offset = jet_diameter_exit/2 * np.sin(angle)
-            exit_verts.append([
-                impact_point[0] + penetration_vector[0] + x_offset,
-                impact_point[1] + penetration_vector[1] + y_offset,
-                impact_point[2] + penetration_vector[2]
-            ])
-        
-        return {
-            'entry_vertices': np.array(entry_verts),
-            'exit_vertices': np.array(exit_verts), 
-            'channel_type': 'heat',
-            'molten_effects': self._create_heat_effects(impact_point, penetration_vector)
-        }
+        # HEAT jet parameters: 6mm entry expanding to 20mm exit
+        jet_diameter_entry = 0.006
+        jet_diameter_exit = 0.020
+        channel_data = self._build_channel(impact_point, impact_angle, penetration_depth,
+                                           jet_diameter_entry/2, jet_diameter_exit/2,
+                                           12, 'heat')
+        channel_data['molten_effects'] = self._create_heat_effects(
+            impact_point, channel_data['penetration_vector']
+        )
+        return channel_data
     
     def _create_generic_penetration_channel(self, impact_point: List[float],
                                           impact_angle: float, penetration_depth: float) -> Dict:
         """Create generic penetration channel."""
         
         channel_diameter = 0.050  # 50mm generic
-        channel_length = penetration_depth / 1000
-        
-        angles = np.linspace(0, 2*np.pi, 8)
-        
-        entry_verts = []
-        for angle in angles:
-            x_offset = channel_diameter/2 * np.cos(angle)
-            y_offset = channel_diameter/2 * np.sin(angle)
-            entry_verts.append([
-                impact_point[0] + x_offset,
-                impact_point[1] + y_offset,
-                impact_point[2]
-            ])
-        
-        return {
-            'entry_vertices': np.array(entry_verts),
-            'channel_type': 'generic'
-        }
+        return self._build_channel(impact_point, impact_angle, penetration_depth,
+                                   channel_diameter/2, None, 8, 'generic')
     
     def _create_armor_response_3d(self, impact_point: List[float], impact_angle: float,
                                 armor, penetration_depth: float) -> Dict:
@@ -593,6 +767,23 @@ class Interactive3DVisualizer:
                                       ammo_type: str, penetration_depth: float) -> Dict:
         """Create behind-armor effects visualization."""
         
+        # Effects are deterministic, so rotate/zoom redraws reuse earlier results
+        impact_point = [round(float(c), 3) for c in impact_point]
+        key = (tuple(impact_point), ammo_type, penetration_depth)
+        effects = self._effects_cache.get(key)
+        if effects is None:
+            if len(self._effects_cache) >= _EFFECTS_CACHE_SIZE:
+                self._effects_cache.pop(next(iter(self._effects_cache)))
+            effects = _freeze_arrays(
+                self._build_behind_armor_effects(impact_point, ammo_type, penetration_depth)
+            )
+            self._effects_cache[key] = effects
+        return effects
+    
+    def _build_behind_armor_effects(self, impact_point: List[float],
+                                    ammo_type: str, penetration_depth: float) -> Dict:
+        """Build behind-armor effect geometry for one impact."""
+        
         if ammo_type == 'kinetic':
             return {
                 'spall_cone': self._create_spall_cone(impact_point, penetration_depth),
@@ -618,43 +809,41 @@ class Interactive3DVisualizer:
         cone_length = penetration_depth / 500  # Proportional to penetration
         
         # Create cone vertices
-        angles = np.linspace(0, 2*np.pi, 16)
-        cone_radius = cone_length * np.tan(np.radians(cone_angle))
+        cone_radius = cone_length * math.tan(math.radians(cone_angle))
         
         # Apex at penetration exit
         apex = [impact_point[0], impact_point[1], impact_point[2] - penetration_depth/1000]
         
-        # Base vertices
-        base_verts = []
-        for angle in angles:
-            x_offset = cone_radius * np.cos(angle)
-            y_offset = cone_radius * np.sin(angle) 
-            base_verts.append([
-                apex[0] + x_offset,
-                apex[1] + y_offset,
-                apex[2] - cone_length
-            ])
+        # Base vertices: ring around the base centroid
+        base_center = np.array([apex[0], apex[1], apex[2] - cone_length])
+        base_verts = _ring_kernel(base_center, cone_radius, *_ring_trig(16))
+        
+        # Closed cone as one padded (F, 4, 3) batch: side triangles from the
+        # apex plus a fan over the base centroid
+        base_next = np.roll(base_verts, -1, axis=0)
+        polys = np.empty((2 * len(base_verts), 4, 3), dtype=_FDTYPE)
+        polys[:len(base_verts), 0] = apex
+        polys[:len(base_verts), 1] = base_verts
+        polys[:len(base_verts), 2:] = base_next[:, None]
+        polys[len(base_verts):, 0] = base_center
+        polys[len(base_verts):, 1] = base_next
+        polys[len(base_verts):, 2:] = base_verts[:, None]
         
         return {
             'apex': apex,
-            'base_vertices': np.array(base_verts),
+            'base_vertices': base_verts,
+            'polys': polys,
             'cone_angle': cone_angle
         }
     
     # Helper methods for creating various 3D effects
     def _create_penetrator_fragments(self, impact_point: List[float], 
-                                   penetration_vector: List[float]) -> List[np.ndarray]:
+                                   penetration_vector: List[float]) -> np.ndarray:
         """Create fragmented penetrator pieces."""
-        fragments = []
-        
-        for i in range(5):  # 5 fragment pieces
-            fragment_pos = [
-                impact_point[0] + penetration_vector[0] * (0.2 + 0.15 * i) + np.random.uniform(-0.05, 0.05),
-                impact_point[1] + np.random.uniform(-0.03, 0.03),
-                impact_point[2] + penetration_vector[2] * (0.2 + 0.15 * i) + np.random.uniform(-0.02, 0.02)
-            ]
-            fragments.append(np.array(fragment_pos))
         
+        # 5 fragment pieces spread along the penetration path
+        fragments = _scatter_points(impact_point, 5, (-0.05, -0.03, -0.02), (0.05, 0.03, 0.02))
+        fragments += (0.2 + 0.15 * np.arange(5))[:, None] * np.asarray(penetration_vector)
         return fragments
     
     def _create_heat_effects(self, impact_point: List[float], 
@@ -684,30 +873,26 @@ class Interactive3DVisualizer:
     def _create_crack_patterns(self, impact_point: List[float], armor_type: str) -> List:
         """Create crack pattern geometry based on armor type."""
         
-        cracks = []
-        
         if armor_type == 'steel':
             # Radial cracks for steel armor
-            for angle in np.linspace(0, 2*np.pi, 8):
-                crack_length = np.random.uniform(0.05, 0.15)
-                crack_end = [
-                    impact_point[0] + crack_length * np.cos(angle),
-                    impact_point[1] + crack_length * np.sin(angle),
-                    impact_point[2]
-                ]
-                cracks.append([impact_point, crack_end])
+            crack_length = 0.05 + 0.1 * _HALTON_OFFSETS[:8, 0]
+            cos_a, sin_a = _ring_trig(8)
+            crack_ends = np.empty((8, 3))
+            crack_ends[:, 0] = impact_point[0] + crack_length * cos_a
+            crack_ends[:, 1] = impact_point[1] + crack_length * sin_a
+            crack_ends[:, 2] = impact_point[2]
         
         elif armor_type == 'composite':
             # Layered failure patterns
-            for i in range(3):
-                layer_offset = i * 0.02
-                crack_end = [
-                    impact_point[0] + np.random.uniform(-0.1, 0.1),
-                    impact_point[1] + np.random.uniform(-0.1, 0.1),
-                    impact_point[2] - layer_offset
-                ]
-                cracks.append([impact_point, crack_end])
+            crack_ends = _scatter_points(impact_point, 3, (-0.1, -0.1, 0.0), (0.1, 0.1, 0.0))
+            crack_ends[:, 2] -= 0.02 * np.arange(3)
+        
+        else:
+            return []
         
+        cracks = np.empty((len(crack_ends), 2, 3), dtype=_FDTYPE)
+        cracks[:, 0] = impact_point
+        cracks[:, 1] = crack_ends
         return cracks
     
     def _create_material_displacement(self, impact_point: List[float], 
@@ -717,24 +902,16 @@ class Interactive3DVisualizer:
         return {
             'displaced_volume': 0.001,  # 1 liter of displaced material
             'displacement_direction': [
-                -np.cos(np.radians(impact_angle)),
+                -math.cos(math.radians(impact_angle)),
                 0,
-                -np.sin(np.radians(impact_angle))
+                -math.sin(math.radians(impact_angle))
             ]
         }
     
     # Additional helper methods for other effects...
-    def _create_armor_fragments(self, impact_point: List[float]) -> List:
+    def _create_armor_fragments(self, impact_point: List[float]) -> np.ndarray:
         """Create armor fragment positions."""
-        fragments = []
-        for i in range(10):
-            fragment_pos = [
-                impact_point[0] + np.random.uniform(-0.2, 0.2),
-                impact_point[1] + np.random.uniform(-0.2, 0.2),
-                impact_point[2] - np.random.uniform(0.05, 0.3)
-            ]
-            fragments.append(fragment_pos)
-        return fragments
+        return _scatter_points(impact_point, 10, (-0.2, -0.2, -0.05), (0.2, 0.2, -0.3))
     
     def _create_penetrator_residual(self, impact_point: List[float]) -> Dict:
         """Create residual penetrator geometry."""
@@ -752,17 +929,9 @@ class Interactive3DVisualizer:
             'pressure_wave': True
         }
     
-    def _create_molten_spray(self, impact_point: List[float]) -> List:
+    def _create_molten_spray(self, impact_point: List[float]) -> np.ndarray:
         """Create molten metal spray pattern."""
-        spray_points = []
-        for i in range(20):
-            spray_point = [
-                impact_point[0] + np.random.uniform(-0.15, 0.15),
-                impact_point[1] + np.random.uniform(-0.15, 0.15),
-                impact_point[2] - np.random.uniform(0.1, 0.5)
-            ]
-            spray_points.append(spray_point)
-        return spray_points
+        return _scatter_points(impact_point, 20, (-0.15, -0.15, -0.1), (0.15, 0.15, -0.5))
     
     def _create_thermal_effects(self, impact_point: List[float]) -> Dict:
         """Create thermal effect zone."""
@@ -775,12 +944,7 @@ class Interactive3DVisualizer:
     def _create_general_effects(self, impact_point: List[float]) -> Dict:
         """Create general behind-armor effects."""
         return {
-            'debris_field': [
-                [impact_point[0] + np.random.uniform(-0.1, 0.1),
-                 impact_point[1] + np.random.uniform(-0.1, 0.1),
-                 impact_point[2] - np.random.uniform(0.05, 0.2)]
-                for _ in range(15)
-            ],
+            'debris_field': _scatter_points(impact_point, 15, (-0.1, -0.1, -0.05), (0.1, 0.1, -0.2)),
             'impact_energy_dissipation': True
         }
 
@@ -794,58 +958,68 @@ class Environmental3DEffects:
         self.atmospheric_layers = []
     
     def create_wind_visualization(self, wind_speed: float, wind_direction: float,
-                                field_size: Tuple[float, float, float] = (20, 20, 10)) -> Dict:
-        """Create 3D wind field visualization."""
+                                field_size: Tuple[float, float, float] = (20, 20, 10),
+                                grid_shape: Tuple[int, int, int] = (8, 6, 4)) -> Dict:
+        """
+        Create 3D wind field visualization.
+        
+        Args:
+            wind_speed: Wind speed in m/s
+            wind_direction: Wind direction in degrees
+            field_size: Field extent (x, y, z) in meters
+            grid_shape: Number of grid points along (x, y, z)
+        
+        Returns:
+            Dictionary with 'positions' and 'vectors' as (N, 3) arrays over the
+            grid, plus 'magnitude', 'base_speed' and 'direction'
+        """
         
         # Create wind vector field
-        x_range = np.linspace(-field_size[0]/2, field_size[0]/2, 8)
-        y_range = np.linspace(-field_size[1]/2, field_size[1]/2, 6)
-        z_range = np.linspace(0, field_size[2], 4)
-        
-        wind_vectors = []
-        
-        for x in x_range:
-            for y in y_range:
-                for z in z_range:
-                    # Wind vector components
-                    wind_x = wind_speed * np.cos(np.radians(wind_direction))
-                    wind_y = wind_speed * np.sin(np.radians(wind_direction))
-                    wind_z = 0  # Simplified horizontal wind
-                    
-                    # Add some turbulence variation
-                    turbulence_factor = 0.1 * np.random.uniform(-1, 1)
-                    wind_x += turbulence_factor
-                    wind_y += turbulence_factor
-                    
-                    wind_vectors.append({
-                        'position': [x, y, z],
-                        'vector': [wind_x, wind_y, wind_z],
-                        'magnitude': wind_speed
-                    })
-        
-        return {'vectors': wind_vectors, 'base_speed': wind_speed, 'direction': wind_direction}
+        x_range = np.linspace(-field_size[0]/2, field_size[0]/2, grid_shape[0])
+        y_range = np.linspace(-field_size[1]/2, field_size[1]/2, grid_shape[1])
+        z_range = np.linspace(0, field_size[2], grid_shape[2])
+        wind_x = wind_speed * math.cos(math.radians(wind_direction))
+        wind_y = wind_speed * math.sin(math.radians(wind_direction))
+        
+        if _HAS_NUMBA and math.prod(grid_shape) > _WIND_JIT_MIN_POINTS:
+            positions, vectors = _wind_field_kernel(x_range, y_range, z_range, wind_x, wind_y)
+        else:
+            X, Y, Z = np.meshgrid(x_range, y_range, z_range, indexing='ij')
+            positions = np.stack([X, Y, Z], axis=-1).reshape(-1, 3)
+            n_points = len(positions)
+            
+            # Uniform horizontal wind plus some turbulence variation
+            turbulence = 0.1 * np.random.uniform(-1, 1, size=n_points)
+            vectors = np.zeros((n_points, 3))
+            vectors[:, 0] = wind_x + turbulence
+            vectors[:, 1] = wind_y + turbulence
+        
+        return {
+            'positions': positions,
+            'vectors': vectors,
+            'magnitude': wind_speed,
+            'base_speed': wind_speed,
+            'direction': wind_direction
+        }
     
     def create_temperature_gradient(self, temp_ground: float, temp_altitude: float,
                                   field_size: Tuple[float, float, float] = (20, 20, 10)) -> Dict:
-        """Create 3D temperature gradient visualization."""
-        
-        temperature_field = []
+        """
+        Create 3D temperature gradient visualization.
         
-        # Create temperature layers
-        z_levels = np.linspace(0, field_size[2], 10)
+        Returns:
+            Dictionary with per-layer 'altitudes', 'temperatures' and
+            'thermal_effects' arrays over 10 levels, plus 'gradient_rate'
+        """
         
-        for z in z_levels:
-            # Linear temperature gradient with altitude
-            temp_at_altitude = temp_ground + (temp_altitude - temp_ground) * (z / field_size[2])
-            
-            temperature_field.append({
-                'altitude': z,
-                'temperature': temp_at_altitude,
-                'thermal_effect': abs(temp_at_altitude - 15) * 0.01  # Effect factor
-            })
+        # Linear temperature gradient with altitude over the temperature layers
+        altitudes = np.linspace(0, field_size[2], 10)
+        temperatures = temp_ground + (temp_altitude - temp_ground) * (altitudes / field_size[2])
         
         return {
-            'temperature_layers': temperature_field,
+            'altitudes': altitudes,
+            'temperatures': temperatures,
+            'thermal_effects': np.abs(temperatures - 15) * 0.01,  # Effect factor
             'gradient_rate': (temp_altitude - temp_ground) / field_size[2]
         }
     
@@ -853,14 +1027,20 @@ class Environmental3DEffects:
                                  pressure: float = 1013.25) -> Dict:
         """Create atmospheric condition visualization."""
         
+        lapse_factor = 1 - 0.0065 * altitude / 288.15
+        
+        # At sea level the upper layer would duplicate the ground layer
+        atmospheric_layers = [{'altitude': 0, 'density': 1.225, 'humidity': humidity}]
+        if altitude != 0:
+            atmospheric_layers.append(
+                {'altitude': altitude, 'density': 1.225 * lapse_factor, 'humidity': humidity * 0.8}
+            )
+        
         return {
-            'air_density': pressure / (287.05 * (15 + 273.15)) * (1 - 0.0065 * altitude / 288.15),
+            'air_density': pressure / _AIR_GAS_DENOM * lapse_factor,
             'humidity_effect': humidity / 100.0,
             'visibility_factor': max(0.1, 1.0 - humidity / 200.0),
-            'atmospheric_layers': [
-                {'altitude': 0, 'density': 1.225, 'humidity': humidity},
-                {'altitude': altitude, 'density': 1.225 * (1 - 0.0065 * altitude / 288.15), 'humidity': humidity * 0.8}
-            ]
+            'atmospheric_layers': atmospheric_layers
         }
 
 
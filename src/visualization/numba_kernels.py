@@ -0,0 +1,155 @@
+"""
+JIT-compiled geometry kernels for interactive 3D penetration analysis.
+
+Slider-driven impact sweeps rebuild penetration channels many times per
+second, so the ring and channel array construction lives here as small
+kernels compiled with Numba when it is installed. Without Numba the same
+functions run as plain NumPy code. The wind field kernel is only worth
+calling for large grids when Numba is available, and the penetration
+kernel serves range/angle parameter sweeps. The serial kernels can also be
+compiled ahead of time with tools/build_kernels.py, which are then used in
+place of the JIT versions.
+"""
+
+import math
+
+import numpy as np
+
+# Optional JIT compilation
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except Exception:
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def ring(center, radius, cos_a, sin_a):
+    """
+    Build a horizontal vertex ring around a center point.
+
+    Args:
+        center: Ring center [x, y, z] as a float64 array
+        radius: Ring radius in meters
+        cos_a: Cosines of the ring angles
+        sin_a: Sines of the ring angles
+
+    Returns:
+        (N, 3) float32 array of ring vertices
+    """
+    out = np.empty((cos_a.shape[0], 3), dtype=np.float32)
+    out[:, 0] = center[0] + radius * cos_a
+    out[:, 1] = center[1] + radius * sin_a
+    out[:, 2] = center[2]
+    return out
+
+
+@njit(cache=True)
+def channel(impact_point, impact_angle_rad, length, r_entry, r_exit, cos_a, sin_a):
+    """
+    Build the entry and exit rings of a straight penetration channel.
+
+    Args:
+        impact_point: Impact coordinates [x, y, z] as a float64 array
+        impact_angle_rad: Impact angle in radians
+        length: Channel length in meters
+        r_entry: Entry ring radius in meters
+        r_exit: Exit ring radius in meters
+        cos_a: Cosines of the ring angles
+        sin_a: Sines of the ring angles
+
+    Returns:
+        (2, N, 3) float32 array holding the entry ring and the exit ring
+    """
+    exit_point = np.empty(3)
+    exit_point[0] = impact_point[0] - length * math.cos(impact_angle_rad)
+    exit_point[1] = impact_point[1]
+    exit_point[2] = impact_point[2] - length * math.sin(impact_angle_rad)
+
+    out = np.empty((2, cos_a.shape[0], 3), dtype=np.float32)
+    out[0] = ring(impact_point, r_entry, cos_a, sin_a)
+    out[1] = ring(exit_point, r_exit, cos_a, sin_a)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def wind_field(x_range, y_range, z_range, wind_x, wind_y):
+    """
+    Build a turbulent horizontal wind field over a regular grid.
+
+    Points are ordered with x outermost and z innermost, matching
+    np.meshgrid(..., indexing='ij'). Each point gets one uniform turbulence
+    sample in [-0.1, 0.1) added to both horizontal components.
+
+    Args:
+        x_range: Grid x coordinates
+        y_range: Grid y coordinates
+        z_range: Grid z coordinates
+        wind_x: Mean wind x component in m/s
+        wind_y: Mean wind y component in m/s
+
+    Returns:
+        Tuple of (N, 3) float64 positions and (N, 3) float64 wind vectors
+    """
+    n_y, n_z = y_range.shape[0], z_range.shape[0]
+    n_points = x_range.shape[0] * n_y * n_z
+    positions = np.empty((n_points, 3))
+    vectors = np.zeros((n_points, 3))
+
+    for i in prange(x_range.shape[0]):
+        for j in range(n_y):
+            for k in range(n_z):
+                idx = (i * n_y + j) * n_z + k
+                turbulence = 0.1 * np.random.uniform(-1.0, 1.0)
+                positions[idx, 0] = x_range[i]
+                positions[idx, 1] = y_range[j]
+                positions[idx, 2] = z_range[k]
+                vectors[idx, 0] = wind_x + turbulence
+                vectors[idx, 1] = wind_y + turbulence
+    return positions, vectors
+
+
+@njit(cache=True)
+def apfsds_penetration(ranges_m, angles_deg, muzzle_velocity, penetrator_diameter, ld_ratio):
+    """
+    APFSDS penetration over paired arrays of ranges and impact angles.
+
+    Elementwise equivalent of APFSDS.calculate_penetration, including the
+    simplified velocity loss of BaseAmmunition.get_velocity_at_range.
+
+    Args:
+        ranges_m: Ranges in meters
+        angles_deg: Impact angles from vertical in degrees
+        muzzle_velocity: Muzzle velocity in m/s
+        penetrator_diameter: Penetrator diameter in mm
+        ld_ratio: Penetrator length to diameter ratio
+
+    Returns:
+        Penetration in mm RHA for each (range, angle) pair
+    """
+    out = np.empty(ranges_m.shape[0])
+    ld_factor = min(1.0 + (ld_ratio - 15) * 0.02, 1.4)
+
+    for i in range(ranges_m.shape[0]):
+        velocity = max(muzzle_velocity * (1 - 0.0001 * ranges_m[i]), 0.1 * muzzle_velocity)
+        base_penetration = (velocity / 1000) ** 1.43 * penetrator_diameter * 25
+        angle_factor = 1.0 / math.sqrt(math.cos(math.radians(angles_deg[i])))
+        out[i] = base_penetration * ld_factor * angle_factor
+    return out
+
+
+# Native builds from tools/build_kernels.py skip JIT warm-up entirely
+try:
+    from .tank_kernels import ring, channel, apfsds_penetration
+except ImportError:
+    pass
+
+
+__all__ = ['ring', 'channel', 'wind_field', 'apfsds_penetration']
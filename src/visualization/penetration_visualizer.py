@@ -5,19 +5,37 @@ This module creates detailed visual representations of armor penetration
 processes, including angle of attack, penetration mechanics, and effects.
 """
 
+import os
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import PatchCollection, EllipseCollection
 import numpy as np
-from typing import Tuple, Dict, Any
+import math
+from typing import Tuple, Dict, Any, Optional
 
 
 class PenetrationVisualizer:
     """Visualizes armor penetration mechanics and effects."""
     
-    def __init__(self):
-        """Initialize the penetration visualizer."""
+    # Armor type to plot color
+    _ARMOR_COLORS = {
+        'RHA': '#808080',
+        'steel': '#696969',
+        'composite': '#8B4513',
+        'reactive': '#FF4500',
+        'spaced': '#4682B4'
+    }
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the penetration visualizer.
+        
+        Args:
+            seed: Optional seed for the fragment/debris layout, for reproducible plots
+        """
         self.fig = None
         self.axes = None
+        self._rng = np.random.default_rng(seed)
         
     def visualize_penetration_process(self, ammo, armor, range_m: float, 
                                     impact_angle: float) -> plt.Figure:
@@ -38,17 +56,20 @@ class PenetrationVisualizer:
         effective_thickness = armor.get_effective_thickness(ammo.penetration_type, impact_angle)
         velocity_at_impact = ammo.get_velocity_at_range(range_m)
         can_defeat = armor.can_defeat(penetration, ammo.penetration_type, impact_angle)
+        armor_color = self._get_armor_color(armor)
         
-        # Create multi-panel visualization with better spacing
-        self.fig, self.axes = plt.subplots(2, 2, figsize=(18, 14))
-        self.fig.subplots_adjust(left=0.08, bottom=0.08, right=0.95, top=0.92, wspace=0.25, hspace=0.35)
+        # Create multi-panel visualization; constrained layout handles spacing
+        # in one pass, so saving does not need a tight-bbox re-render
+        self.fig, self.axes = plt.subplots(2, 2, figsize=(18, 14), constrained_layout=True)
         
         # Panel 1: Angle of Attack and Armor Geometry
-        self._plot_angle_of_attack(ammo, armor, impact_angle, self.axes[0, 0])
+        self._plot_angle_of_attack(ammo, armor, impact_angle, effective_thickness,
+                                   armor_color, self.axes[0, 0])
         
         # Panel 2: Penetration Mechanism (ammo-type specific)
         self._plot_penetration_mechanism(ammo, armor, penetration, effective_thickness,
-                                       velocity_at_impact, can_defeat, self.axes[0, 1])
+                                       velocity_at_impact, can_defeat, armor_color,
+                                       self.axes[0, 1])
         
         # Panel 3: Behind-Armor Effects
         self._plot_behind_armor_effects(ammo, armor, penetration, effective_thickness,
@@ -61,23 +82,23 @@ class PenetrationVisualizer:
         
         return self.fig
     
-    def _plot_angle_of_attack(self, ammo, armor, impact_angle: float, ax):
+    def _plot_angle_of_attack(self, ammo, armor, impact_angle: float,
+                              effective_thickness: float, armor_color: str, ax):
         """Plot angle of attack and armor geometry."""
         ax.set_xlim(-2, 8)
         ax.set_ylim(-1, 6)
         
         # Draw armor plate
         armor_thickness = min(armor.thickness / 100, 2.0)  # Scale for visualization
-        armor_angle_rad = np.radians(90 - impact_angle)  # Convert to slope angle
+        armor_angle_rad = math.radians(90 - impact_angle)  # Convert to slope angle
+        slope_dx = armor_thickness * math.sin(armor_angle_rad)
+        slope_dy = armor_thickness * math.cos(armor_angle_rad)
         
         # Armor coordinates
-        armor_x = [2, 6, 6 + armor_thickness * np.sin(armor_angle_rad), 
-                  2 + armor_thickness * np.sin(armor_angle_rad)]
-        armor_y = [2, 2, 2 - armor_thickness * np.cos(armor_angle_rad), 
-                  2 - armor_thickness * np.cos(armor_angle_rad)]
+        armor_x = (2, 6, 6 + slope_dx, 2 + slope_dx)
+        armor_y = (2, 2, 2 - slope_dy, 2 - slope_dy)
         
         # Draw armor
-        armor_color = self._get_armor_color(armor)
         ax.fill(armor_x, armor_y, color=armor_color, alpha=0.8, 
                label=f'{armor.armor_type.upper()} Armor')
         
@@ -103,7 +124,6 @@ class PenetrationVisualizer:
                fontsize=12, color='blue', fontweight='bold')
         
         # Add thickness annotations with better positioning
-        effective_thickness = armor.get_effective_thickness(ammo.penetration_type, impact_angle)
         ax.text(4, 0.2, f'Nominal: {armor.thickness:.0f}mm\nEffective: {effective_thickness:.0f}mm RHA', 
                fontsize=9, ha='center', bbox=dict(boxstyle='round', facecolor='yellow', alpha=0.7))
         
@@ -116,15 +136,14 @@ class PenetrationVisualizer:
     
     def _plot_penetration_mechanism(self, ammo, armor, penetration: float, 
                                   effective_thickness: float, velocity: float,
-                                  can_defeat: bool, ax):
+                                  can_defeat: bool, armor_color: str, ax):
         """Plot ammunition-specific penetration mechanism."""
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 6)
         
         # Draw armor cross-section
-        armor_x = [3, 7, 7, 3]
-        armor_y = [1, 1, 5, 5]
-        armor_color = self._get_armor_color(armor)
+        armor_x = (3, 7, 7, 3)
+        armor_y = (1, 1, 5, 5)
         ax.fill(armor_x, armor_y, color=armor_color, alpha=0.8, label='Armor')
         
         if ammo.penetration_type == 'kinetic':
@@ -178,9 +197,8 @@ class PenetrationVisualizer:
             ax.add_patch(hole)
             
             # Show behind-armor debris
-            debris_x = np.random.uniform(7.2, 9, 8)
-            debris_y = np.random.uniform(1.5, 4.5, 8)
-            ax.scatter(debris_x, debris_y, c='red', s=20, alpha=0.7, label='Armor Fragments')
+            debris = self._rng.uniform([7.2, 1.5], [9, 4.5], size=(8, 2))
+            ax.scatter(debris[:, 0], debris[:, 1], c='red', s=20, alpha=0.7, label='Armor Fragments')
     
     def _draw_chemical_penetration(self, ammo, can_defeat: bool, ax):
         """Draw HEAT penetration mechanism."""
@@ -201,8 +219,9 @@ class PenetrationVisualizer:
         else:
             # Disrupted jet
             jet_fragments_x = np.linspace(2, 6, 10)
-            jet_fragments_y = 3 + np.random.uniform(-0.3, 0.3, 10)
-            ax.scatter(jet_fragments_x, jet_fragments_y, c='orange', s=15, alpha=0.7, label='Disrupted Jet')
+            jet_fragments_y = 3 + self._rng.uniform(-0.3, 0.3, 10)
+            ax.scatter(jet_fragments_x, jet_fragments_y, c='orange', s=15, alpha=0.7, label='Disrupted Jet',
+                       rasterized=True)
         
         # Show explosive effect
         explosion_circle = patches.Circle((1.5, 3), 0.8, fill=False, 
@@ -228,14 +247,16 @@ class PenetrationVisualizer:
             ax.fill(spall_x, spall_y, color='gray', alpha=0.7, label='Spall Cone')
             
             # Spall fragments
-            fragment_x = np.random.uniform(7.5, 9, 12)
-            fragment_y = np.random.uniform(2, 4, 12)
-            ax.scatter(fragment_x, fragment_y, c='darkgray', s=15, alpha=0.8, label='Spall Fragments')
+            fragments = self._rng.uniform([7.5, 2], [9, 4], size=(12, 2))
+            ax.scatter(fragments[:, 0], fragments[:, 1], c='darkgray', s=15, alpha=0.8, label='Spall Fragments',
+                       rasterized=True)
         else:
-            # Show shock wave absorption
-            for r in [0.3, 0.6, 0.9]:
-                shock_ring = patches.Circle((5, 3), r, fill=False, edgecolor='blue', alpha=0.4)
-                ax.add_patch(shock_ring)
+            # Show shock wave absorption as concentric rings of radius 0.3, 0.6, 0.9
+            diameters = np.array([0.6, 1.2, 1.8])
+            shock_rings = EllipseCollection(diameters, diameters, np.zeros(3), units='xy',
+                                            offsets=[[5, 3]] * 3, transOffset=ax.transData,
+                                            facecolors='none', edgecolors='blue', alpha=0.4)
+            ax.add_collection(shock_rings)
             ax.text(5, 1.5, 'Shock Absorbed', fontsize=10, ha='center', color='blue')
     
     def _plot_behind_armor_effects(self, ammo, armor, penetration: float,
@@ -252,52 +273,48 @@ class PenetrationVisualizer:
         
         # Draw equipment positions
         equipment_positions = [(2, 3), (4, 2), (6, 4), (8, 2.5)]
+        equipment = [patches.Rectangle((x-0.3, y-0.3), 0.6, 0.6) for x, y in equipment_positions]
+        ax.add_collection(PatchCollection(equipment, facecolor='brown', edgecolor='none', alpha=0.6))
         for i, (x, y) in enumerate(equipment_positions):
-            equip = patches.Rectangle((x-0.3, y-0.3), 0.6, 0.6, color='brown', alpha=0.6)
-            ax.add_patch(equip)
             ax.text(x, y, f'E{i+1}', fontsize=8, ha='center', va='center')
         
         if not can_defeat:
             # Show penetration effects based on ammo type
             if ammo.penetration_type == 'kinetic':
                 # High velocity fragments
-                fragment_x = np.random.uniform(1.5, 8, 15)
-                fragment_y = np.random.uniform(1.5, 4.5, 15)
-                ax.scatter(fragment_x, fragment_y, c='red', s=25, alpha=0.8, 
-                          marker='*', label='High-Velocity Fragments')
+                fragments = self._rng.uniform([1.5, 1.5], [8, 4.5], size=(15, 2))
+                ax.scatter(fragments[:, 0], fragments[:, 1], c='red', s=25, alpha=0.8, 
+                          marker='*', label='High-Velocity Fragments', rasterized=True)
                 ax.arrow(1, 3, 6, 0, head_width=0.2, head_length=0.3, 
                         fc='darkred', ec='darkred', linewidth=3)
                 
             elif ammo.penetration_type == 'chemical':
                 # HEAT jet path and molten metal
                 jet_x = np.linspace(1, 7, 20)
-                jet_y = 3 + np.random.uniform(-0.2, 0.2, 20)
+                jet_y = 3 + self._rng.uniform(-0.2, 0.2, 20)
                 ax.plot(jet_x, jet_y, 'yellow', linewidth=3, alpha=0.8, label='Jet Path')
                 
-                splash_x = np.random.uniform(6, 9, 10)
-                splash_y = np.random.uniform(2, 4, 10)
-                ax.scatter(splash_x, splash_y, c='orange', s=30, alpha=0.7, 
-                          marker='o', label='Molten Metal')
+                splash = self._rng.uniform([6, 2], [9, 4], size=(10, 2))
+                ax.scatter(splash[:, 0], splash[:, 1], c='orange', s=30, alpha=0.7, 
+                          marker='o', label='Molten Metal', rasterized=True)
                 
             elif ammo.penetration_type == 'spalling':
                 # Spall fragment cone
-                spall_angles = np.linspace(-np.pi/4, np.pi/4, 20)
-                spall_distances = np.random.uniform(2, 6, 20)
-                spall_x = 1 + spall_distances * np.cos(spall_angles)
-                spall_y = 3 + spall_distances * np.sin(spall_angles)
-                ax.scatter(spall_x, spall_y, c='gray', s=20, alpha=0.8, 
-                          marker='s', label='Spall Fragments')
+                spall = 1 + 3j + self._rng.uniform(2, 6, 20) * np.exp(1j * np.linspace(-np.pi/4, np.pi/4, 20))
+                ax.scatter(spall.real, spall.imag, c='gray', s=20, alpha=0.8, 
+                          marker='s', label='Spall Fragments', rasterized=True)
             
             # Mark damaged equipment
             num_damaged = min(3, len(equipment_positions))
-            damaged_indices = np.random.choice(len(equipment_positions), 
-                                             size=num_damaged, replace=False)
+            damaged_indices = self._rng.choice(len(equipment_positions), size=num_damaged,
+                                               replace=False, shuffle=False)
+            damage_indicators = []
             for i in damaged_indices:
                 x, y = equipment_positions[i]
-                damage_indicator = patches.Rectangle((x-0.35, y-0.35), 0.7, 0.7, 
-                                                   fill=False, edgecolor='red', linewidth=3)
-                ax.add_patch(damage_indicator)
+                damage_indicators.append(patches.Rectangle((x-0.35, y-0.35), 0.7, 0.7))
                 ax.text(x, y-0.6, 'DAMAGED', fontsize=6, ha='center', color='red')
+            ax.add_collection(PatchCollection(damage_indicators, facecolor='none',
+                                              edgecolor='red', linewidth=3))
         else:
             # No penetration
             ax.text(5, 3, 'ARMOR HOLDS\nNO BEHIND-ARMOR EFFECTS', 
@@ -359,27 +376,18 @@ Protection: {effective_thickness/armor.thickness:.2f}x"""
     
     def _get_armor_color(self, armor) -> str:
         """Get color for armor type visualization."""
-        color_map = {
-            'RHA': '#808080',
-            'steel': '#696969',
-            'composite': '#8B4513',
-            'reactive': '#FF4500',
-            'spaced': '#4682B4'
-        }
-        return color_map.get(armor.armor_type, '#808080')
+        return self._ARMOR_COLORS.get(armor.armor_type, '#808080')
     
     def save_plot(self, filename: str = 'penetration_analysis.png'):
         """Save the current plot to file."""
         if self.fig:
             # Ensure results directory exists
-            import os
             results_dir = 'results'
-            if not os.path.exists(results_dir):
-                os.makedirs(results_dir)
+            os.makedirs(results_dir, exist_ok=True)
             
             # Save to results directory
             filepath = os.path.join(results_dir, filename)
-            self.fig.savefig(filepath, dpi=300, bbox_inches='tight')
+            self.fig.savefig(filepath, dpi=300)
             print(f"Penetration analysis plot saved as {filepath}")
     
     def show_plot(self):
@@ -401,4 +409,6 @@ Protection: {effective_thickness/armor.thickness:.2f}x"""
             except:
                 pass  # Fallback gracefully if maximization fails
             
+            # Schedule a single draw of the finished figure before the event loop starts
+            self.fig.canvas.draw_idle()
             plt.show()
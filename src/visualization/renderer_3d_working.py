@@ -7,15 +7,143 @@ the existing codebase and creates interactive matplotlib 3D visualizations.
 
 import numpy as np
 import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
-import matplotlib.patches as patches
-from matplotlib.widgets import Slider, Button, CheckButtons
 import matplotlib.animation as animation
-from typing import List, Dict, Tuple, Optional, Any, Callable
-import math
+from typing import List, Tuple, Optional, Any, Callable
+import functools
+import importlib
 
 from .interactive_3d import Interactive3DVisualizer
+from .numba_kernels import apfsds_penetration as _apfsds_penetration_kernel
+
+# APFSDS as seen by callers of this module: the package is imported both as
+# src.visualization and as a top-level visualization, so resolve ammunition
+# from the same root
+_PACKAGE_ROOT = __package__.rpartition('.')[0]
+_APFSDS = importlib.import_module(f'{_PACKAGE_ROOT}.ammunition' if _PACKAGE_ROOT
+                                  else 'ammunition').APFSDS
+
+
+# Color schemes for the different visualization styles
+_COLOR_SCHEMES = {
+    'professional': {
+        'tank_hull': '#2E4057',      # Dark blue-gray
+        'tank_turret': '#3C5875',    # Medium blue-gray  
+        'tank_gun': '#1A1A1A',      # Dark gray
+        'tank_tracks': '#333333',    # Charcoal
+        'armor_zones': '#FF6B6B',    # Red for armor
+        'trajectory': '#4ECDC4',     # Teal for trajectory
+        'impact_point': '#FFE66D',   # Yellow for impact
+        'penetration': '#FF4757',    # Red for penetration
+        'background': '#F8F9FA'      # Light background
+    },
+    'tactical': {
+        'tank_hull': '#2D5016',      # Military green
+        'tank_turret': '#3E6B1F',    # Darker green
+        'tank_gun': '#1C1C1C',      # Black
+        'tank_tracks': '#2C2C2C',    # Dark gray
+        'armor_zones': '#C0392B',    # Dark red
+        'trajectory': '#F39C12',     # Orange trajectory
+        'impact_point': '#E74C3C',   # Red impact
+        'penetration': '#8E44AD',    # Purple penetration
+        'background': '#2C3E50'      # Dark background
+    },
+    'educational': {
+        'tank_hull': '#3498DB',      # Blue hull
+        'tank_turret': '#2980B9',    # Darker blue
+        'tank_gun': '#34495E',       # Dark blue-gray
+        'tank_tracks': '#7F8C8D',    # Gray tracks
+        'armor_zones': '#E74C3C',    # Red zones
+        'trajectory': '#F1C40F',     # Yellow trajectory
+        'impact_point': '#E67E22',   # Orange impact
+        'penetration': '#9B59B6',    # Purple penetration
+        'background': '#ECF0F1'      # Light gray background
+    }
+}
+
+
+# Simplified tank dimensions (m); the tank is positioned at the origin
+_TANK_LENGTH = 7.0
+_TANK_WIDTH = 3.7
+_TANK_HEIGHT = 2.4
+
+# Hull vertices (simplified box with sloped front)
+_HULL_VERTS = np.array([
+    # Rear face
+    [-_TANK_LENGTH/2, -_TANK_WIDTH/2, 0],
+    [-_TANK_LENGTH/2, _TANK_WIDTH/2, 0], 
+    [-_TANK_LENGTH/2, _TANK_WIDTH/2, _TANK_HEIGHT*0.75],
+    [-_TANK_LENGTH/2, -_TANK_WIDTH/2, _TANK_HEIGHT*0.75],
+    
+    # Front face (sloped)
+    [_TANK_LENGTH/2, -_TANK_WIDTH/2, 0.3],
+    [_TANK_LENGTH/2, _TANK_WIDTH/2, 0.3],
+    [_TANK_LENGTH/2, _TANK_WIDTH/2, _TANK_HEIGHT*0.75],
+    [_TANK_LENGTH/2, -_TANK_WIDTH/2, _TANK_HEIGHT*0.75],
+], dtype=np.float32)
+
+# Hull box faces as indices into the 8 hull vertices
+_HULL_FACES = np.array([
+    [0, 1, 2, 3],  # Rear
+    [4, 7, 6, 5],  # Front 
+    [0, 4, 5, 1],  # Bottom
+    [2, 6, 7, 3],  # Top
+    [0, 3, 7, 4],  # Left side
+    [1, 5, 6, 2]   # Right side
+], dtype=np.int8)
+
+# Final hull polygons, gathered once at import
+_HULL_POLYS = _HULL_VERTS[_HULL_FACES]
+_HULL_POLYS.setflags(write=False)
+
+# Reference ground plane as a single (1, 4, 3) polygon
+_GROUND = np.array([[[-5, -8, 0], [25, -8, 0], [25, 8, 0], [-5, 8, 0]]], dtype=np.float32)
+_GROUND.setflags(write=False)
+
+
+# Unit circle tables (cos, sin columns) for the fixed ring resolutions used below.
+# Vertex data is float32 throughout; screen precision does not need more.
+_UNIT_RINGS = {
+    n: np.column_stack([np.cos(angles), np.sin(angles)])
+    for n in (8, 12, 16)
+    for angles in [np.linspace(0, 2*np.pi, n, endpoint=False, dtype=np.float32)]
+}
+
+# Normalized trajectory parameter: 0 at launch, 1 at impact
+_TRAJECTORY_U = np.linspace(0, 1, 50, dtype=np.float32)
+
+# Simplified trajectory end heights in scene units
+_LAUNCH_HEIGHT = 3.0
+_IMPACT_HEIGHT = 0.5
+
+
+def _scaled_range(target_range: float) -> float:
+    """Scene x coordinate of the target, rounded so it can key the trajectory cache."""
+    return round(min(target_range / 100, 20), 2)  # Scale to fit our view
+
+
+@functools.lru_cache(maxsize=16)
+def _trajectory(range_scaled: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Cached read-only (x, y, z) parabolic trajectory from launch to range_scaled."""
+    
+    x_points = -5 + (range_scaled + 5) * _TRAJECTORY_U
+    z_points = _LAUNCH_HEIGHT - (_LAUNCH_HEIGHT - _IMPACT_HEIGHT) * _TRAJECTORY_U**2
+    z_points -= 0.1 * _TRAJECTORY_U**1.5  # Add some drop
+    y_points = np.zeros_like(x_points)
+    
+    for points in (x_points, y_points, z_points):
+        points.setflags(write=False)
+    return x_points, y_points, z_points
+
+
+def _ring_points(center_x: float, center_y: float, z: float, radius: float,
+                 n_points: int) -> np.ndarray:
+    """(n_points, 3) horizontal ring scaled from the cached unit circle table."""
+    
+    points = np.empty((n_points, 3), dtype=np.float32)
+    points[:, :2] = radius * _UNIT_RINGS[n_points] + (center_x, center_y)
+    points[:, 2] = z
+    return points
 
 
 class Working3DRenderer:
@@ -42,49 +170,24 @@ class Working3DRenderer:
         # 3D visualization components
         self.visualizer = Interactive3DVisualizer()
         
-        # Color schemes
-        self.color_schemes = self._setup_color_schemes()
-        
-    def _setup_color_schemes(self) -> Dict[str, Dict]:
-        """Set up color schemes for different visualization styles."""
-        
-        schemes = {
-            'professional': {
-                'tank_hull': '#2E4057',      # Dark blue-gray
-                'tank_turret': '#3C5875',    # Medium blue-gray  
-                'tank_gun': '#1A1A1A',      # Dark gray
-                'tank_tracks': '#333333',    # Charcoal
-                'armor_zones': '#FF6B6B',    # Red for armor
-                'trajectory': '#4ECDC4',     # Teal for trajectory
-                'impact_point': '#FFE66D',   # Yellow for impact
-                'penetration': '#FF4757',    # Red for penetration
-                'background': '#F8F9FA'      # Light background
-            },
-            'tactical': {
-                'tank_hull': '#2D5016',      # Military green
-                'tank_turret': '#3E6B1F',    # Darker green
-                'tank_gun': '#1C1C1C',      # Black
-                'tank_tracks': '#2C2C2C',    # Dark gray
-                'armor_zones': '#C0392B',    # Dark red
-                'trajectory': '#F39C12',     # Orange trajectory
-                'impact_point': '#E74C3C',   # Red impact
-                'penetration': '#8E44AD',    # Purple penetration
-                'background': '#2C3E50'      # Dark background
-            },
-            'educational': {
-                'tank_hull': '#3498DB',      # Blue hull
-                'tank_turret': '#2980B9',    # Darker blue
-                'tank_gun': '#34495E',       # Dark blue-gray
-                'tank_tracks': '#7F8C8D',    # Gray tracks
-                'armor_zones': '#E74C3C',    # Red zones
-                'trajectory': '#F1C40F',     # Yellow trajectory
-                'impact_point': '#E67E22',   # Orange impact
-                'penetration': '#9B59B6',    # Purple penetration
-                'background': '#ECF0F1'      # Light gray background
-            }
-        }
-        
-        return schemes
+        # Color scheme for the selected style
+        self.color_schemes = _COLOR_SCHEMES
+        self.colors = _COLOR_SCHEMES[style]
+    
+    def reset(self, style: Optional[str] = None):
+        """
+        Clear the current figure so the next visualization redraws into it.
+        
+        Args:
+            style: Optional new visualization style for the next drawing
+        """
+        if style is not None:
+            self.style = style
+            self.colors = _COLOR_SCHEMES[style]
+        
+        if self.fig is not None:
+            self.fig.clear()
+            self.ax_3d = None
     
     def create_3d_visualization(self, ammunition, armor, 
                                target_range: float = 2000.0,
@@ -102,9 +205,12 @@ class Working3DRenderer:
             Complete matplotlib figure with 3D visualization
         """
         
-        # Set up the figure and 3D axis
-        self.fig = plt.figure(figsize=self.figsize)
+        # Set up the figure and 3D axis, reusing a figure emptied by reset()
+        if self.fig is None or self.fig.axes:
+            self.fig = plt.figure(figsize=self.figsize)
         self.ax_3d = self.fig.add_subplot(111, projection='3d')
+        # Fixed margins; legend and info box are already anchored explicitly
+        self.fig.subplots_adjust(left=0.05, right=0.95, top=0.92, bottom=0.08)
         
         # Set up the 3D environment
         self._setup_3d_environment()
@@ -132,13 +238,54 @@ class Working3DRenderer:
         
         return self.fig
     
+    def calculate_penetration_sweep(self, ammunition, armor, target_ranges,
+                                    impact_angles) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate penetration and effective armor thickness over a parameter sweep.
+        
+        Args:
+            ammunition: Ammunition object
+            armor: Armor object
+            target_ranges: Distances to target in meters (scalar or array)
+            impact_angles: Impact angles in degrees (scalar or array)
+            
+        Returns:
+            Tuple of (penetration, effective_thickness) arrays in mm RHA, broadcast
+            to the common shape of the inputs
+        """
+        
+        ranges, angles = np.broadcast_arrays(np.asarray(target_ranges, dtype=float),
+                                             np.asarray(impact_angles, dtype=float))
+        # Ranges are passed on in the same units as create_3d_visualization
+        ranges_arg = ranges.ravel() / 1000
+        angles_flat = angles.ravel()
+        
+        if type(ammunition) is _APFSDS:
+            # The compiled kernel mirrors APFSDS.calculate_penetration exactly, so
+            # subclasses, which may override it, take the scalar path
+            penetration = _apfsds_penetration_kernel(
+                np.ascontiguousarray(ranges_arg), np.ascontiguousarray(angles_flat),
+                float(ammunition.muzzle_velocity), float(ammunition.penetrator_diameter),
+                float(ammunition.ld_ratio)
+            )
+        else:
+            penetration = np.array([ammunition.calculate_penetration(r, a)
+                                    for r, a in zip(ranges_arg, angles_flat)])
+        
+        # Armor types model obliquity and per-threat protection differently,
+        # so ask the armor once per distinct angle for this round's type
+        unique_angles, angle_index = np.unique(angles_flat, return_inverse=True)
+        effective_thickness = np.array([armor.get_effective_thickness(ammunition.penetration_type,
+                                                                      float(angle))
+                                        for angle in unique_angles])[angle_index]
+        
+        return penetration.reshape(ranges.shape), effective_thickness.reshape(ranges.shape)
+    
     def _setup_3d_environment(self):
         """Set up the 3D plotting environment and axes."""
         
-        colors = self.color_schemes[self.style]
-        
         # Set background color
-        self.fig.patch.set_facecolor(colors['background'])
+        self.fig.patch.set_facecolor(self.colors['background'])
         
         # Set axis labels and styling
         self.ax_3d.set_xlabel('Distance (m)', fontsize=10, fontweight='bold')
@@ -159,87 +306,42 @@ class Working3DRenderer:
     def _create_ground_plane(self):
         """Create a ground plane for reference."""
         
-        # Ground plane vertices
-        ground_x = [-5, 25, 25, -5]
-        ground_y = [-8, -8, 8, 8]
-        ground_z = [0, 0, 0, 0]
-        
         # Create ground plane
-        ground_verts = [list(zip(ground_x, ground_y, ground_z))]
-        
-        ground_collection = Poly3DCollection(ground_verts, alpha=0.2, 
+        ground_collection = Poly3DCollection(_GROUND, alpha=0.2, 
                                            facecolors='lightgray', 
-                                           edgecolors='gray', linewidths=0.5)
+                                           edgecolors='gray', linewidths=0.5,
+                                           rasterized=True)
         
         self.ax_3d.add_collection3d(ground_collection)
     
     def _render_simple_tank(self):
         """Render a simplified 3D tank model."""
         
-        colors = self.color_schemes[self.style]
-        
-        # Tank positioned at origin
-        tank_length = 7.0
-        tank_width = 3.7
-        tank_height = 2.4
-        
-        # Hull vertices (simplified box with sloped front)
-        hull_vertices = np.array([
-            # Rear face
-            [-tank_length/2, -tank_width/2, 0],
-            [-tank_length/2, tank_width/2, 0], 
-            [-tank_length/2, tank_width/2, tank_height*0.75],
-            [-tank_length/2, -tank_width/2, tank_height*0.75],
-            
-            # Front face (sloped)
-            [tank_length/2, -tank_width/2, 0.3],
-            [tank_length/2, tank_width/2, 0.3],
-            [tank_length/2, tank_width/2, tank_height*0.75],
-            [tank_length/2, -tank_width/2, tank_height*0.75],
-        ])
-        
-        # Hull faces
-        hull_faces = [
-            [0, 1, 2, 3],  # Rear
-            [4, 7, 6, 5],  # Front 
-            [0, 4, 5, 1],  # Bottom
-            [2, 6, 7, 3],  # Top
-            [0, 3, 7, 4],  # Left side
-            [1, 5, 6, 2]   # Right side
-        ]
-        
-        hull_collection = Poly3DCollection([hull_vertices[face] for face in hull_faces], 
-                                         alpha=0.8, facecolors=colors['tank_hull'],
-                                         edgecolors='black', linewidths=0.5)
+        # Hull (precomputed (6, 4, 3) polygons)
+        hull_collection = Poly3DCollection(_HULL_POLYS, 
+                                         alpha=0.8, facecolors=self.colors['tank_hull'],
+                                         edgecolors='black', linewidths=0.5,
+                                         rasterized=True)
         self.ax_3d.add_collection3d(hull_collection)
         
         # Turret (simplified cylinder)
-        turret_center = [1.0, 0, tank_height*0.75]
+        turret_center = [1.0, 0, _TANK_HEIGHT*0.75]
         turret_radius = 1.5
         turret_height = 1.0
         
         # Create turret cylinder
-        angles = np.linspace(0, 2*np.pi, 16)
-        turret_bottom = []
-        turret_top = []
-        
-        for angle in angles:
-            x = turret_center[0] + turret_radius * np.cos(angle)
-            y = turret_center[1] + turret_radius * np.sin(angle)
-            turret_bottom.append([x, y, turret_center[2]])
-            turret_top.append([x, y, turret_center[2] + turret_height])
-        
-        # Turret side faces
-        turret_faces = []
-        for i in range(len(angles)):
-            next_i = (i + 1) % len(angles)
-            face = [turret_bottom[i], turret_bottom[next_i], 
-                   turret_top[next_i], turret_top[i]]
-            turret_faces.append(face)
+        turret_bottom = _ring_points(*turret_center, turret_radius, 16)
+        turret_top = turret_bottom.copy()
+        turret_top[:, 2] += turret_height
+        
+        # Turret side faces as one (N, 4, 3) quad array
+        turret_faces = np.stack([turret_bottom, np.roll(turret_bottom, -1, axis=0),
+                                 np.roll(turret_top, -1, axis=0), turret_top], axis=1)
         
         turret_collection = Poly3DCollection(turret_faces, alpha=0.8, 
-                                           facecolors=colors['tank_turret'],
-                                           edgecolors='black', linewidths=0.5)
+                                           facecolors=self.colors['tank_turret'],
+                                           edgecolors='black', linewidths=0.5,
+                                           rasterized=True)
         self.ax_3d.add_collection3d(turret_collection)
         
         # Gun barrel
@@ -249,29 +351,22 @@ class Working3DRenderer:
         self.ax_3d.plot([gun_start[0], gun_end[0]], 
                        [gun_start[1], gun_end[1]], 
                        [gun_start[2], gun_end[2]], 
-                       color=colors['tank_gun'], linewidth=8, alpha=0.9)
+                       color=self.colors['tank_gun'], linewidth=8, alpha=0.9)
     
     def _render_simple_trajectory(self, target_range: float):
         """Render a simplified ballistic trajectory."""
         
-        colors = self.color_schemes[self.style]
-        
         # Convert range from meters to our coordinate system (scaled down)
-        range_scaled = min(target_range / 100, 20)  # Scale to fit our view
+        range_scaled = _scaled_range(target_range)
+        launch_height = _LAUNCH_HEIGHT
+        impact_height = _IMPACT_HEIGHT
         
-        # Create parabolic trajectory
-        x_points = np.linspace(-5, range_scaled, 50)
-        launch_height = 3.0
-        impact_height = 0.5
-        
-        # Parabolic trajectory calculation
-        z_points = launch_height - (launch_height - impact_height) * ((x_points + 5) / (range_scaled + 5))**2
-        z_points -= 0.1 * ((x_points + 5) / (range_scaled + 5))**1.5  # Add some drop
-        y_points = np.zeros_like(x_points)
+        # Parabolic trajectory
+        x_points, y_points, z_points = _trajectory(range_scaled)
         
         # Plot trajectory line
         self.ax_3d.plot(x_points, y_points, z_points, 
-                       color=colors['trajectory'], linewidth=3, alpha=0.8,
+                       color=self.colors['trajectory'], linewidth=3, alpha=0.8,
                        label='Ballistic Trajectory')
         
         # Mark launch point
@@ -282,7 +377,7 @@ class Working3DRenderer:
         
         # Mark impact point
         self.ax_3d.scatter([range_scaled], [0], [impact_height], 
-                         c=colors['impact_point'], s=150, marker='X', 
+                         c=self.colors['impact_point'], s=150, marker='X', 
                          edgecolors='black', linewidth=2, 
                          label='Impact Point')
         
@@ -292,8 +387,7 @@ class Working3DRenderer:
                                target_range: float):
         """Render impact analysis visualization."""
         
-        colors = self.color_schemes[self.style]
-        range_scaled = min(target_range / 100, 20)
+        range_scaled = _scaled_range(target_range)
         
         # Impact point
         impact_point = [range_scaled, 0, 0.5]
@@ -301,12 +395,13 @@ class Working3DRenderer:
         # Penetration success visualization
         if penetration > effective_thickness:
             # Successful penetration - show penetration channel
-            channel_end = [impact_point[0], impact_point[1], impact_point[2] - 0.3]
+            channel_end = np.array([impact_point[0], impact_point[1], impact_point[2] - 0.3],
+                                   dtype=np.float32)
             
             self.ax_3d.plot([impact_point[0], channel_end[0]], 
                            [impact_point[1], channel_end[1]], 
                            [impact_point[2], channel_end[2]], 
-                           color=colors['penetration'], linewidth=6, alpha=0.8,
+                           color=self.colors['penetration'], linewidth=6, alpha=0.8,
                            label='Penetration Channel')
             
             # Behind-armor effects (spall cone)
@@ -315,42 +410,26 @@ class Working3DRenderer:
             cone_radius = 0.5
             
             # Create simple spall cone
-            angles = np.linspace(0, 2*np.pi, 8)
-            spall_base = []
-            
-            for angle in angles:
-                x = apex[0] + cone_radius * np.cos(angle)
-                y = apex[1] + cone_radius * np.sin(angle)
-                z = apex[2] - cone_height
-                spall_base.append([x, y, z])
+            spall_base = _ring_points(apex[0], apex[1], apex[2] - cone_height, cone_radius, 8)
             
-            # Spall cone faces
-            spall_faces = []
-            for i in range(len(angles)):
-                next_i = (i + 1) % len(angles)
-                face = [apex, spall_base[i], spall_base[next_i]]
-                spall_faces.append(face)
+            # Spall cone faces as one (N, 3, 3) triangle array
+            spall_faces = np.stack([np.broadcast_to(apex, spall_base.shape), spall_base,
+                                    np.roll(spall_base, -1, axis=0)], axis=1)
             
             spall_collection = Poly3DCollection(spall_faces, alpha=0.5,
                                               facecolors='orange',
                                               edgecolors='darkorange',
-                                              linewidths=1)
+                                              linewidths=1, rasterized=True)
             self.ax_3d.add_collection3d(spall_collection)
             
         else:
             # Failed penetration - show impact crater
             crater_radius = 0.2
-            angles = np.linspace(0, 2*np.pi, 12)
-            crater_points = []
-            
-            for angle in angles:
-                x = impact_point[0] + crater_radius * np.cos(angle)
-                y = impact_point[1] + crater_radius * np.sin(angle)
-                crater_points.append([x, y, impact_point[2]])
+            crater_points = _ring_points(*impact_point, crater_radius, 12)
             
             crater_collection = Poly3DCollection([crater_points], alpha=0.6,
                                                facecolors='gray',
-                                               edgecolors='darkgray')
+                                               edgecolors='darkgray', rasterized=True)
             self.ax_3d.add_collection3d(crater_collection)
     
     def _apply_visual_styling(self, ammo_name: str, armor_name: str, 
@@ -377,9 +456,6 @@ class Working3DRenderer:
         
         # Add legend
         self.ax_3d.legend(loc='upper right', bbox_to_anchor=(1.0, 0.85), fontsize=9)
-        
-        # Tight layout
-        plt.tight_layout()
     
     def save_visualization(self, filename: str, dpi: int = 300):
         """Save the current 3D visualization to file."""
@@ -411,7 +487,8 @@ class Simple3DAnimator(Working3DRenderer):
                                    duration: float = 3.0) -> animation.FuncAnimation:
         """Create a simple animated penetration sequence."""
         
-        self.fig = plt.figure(figsize=self.figsize)
+        # Animation frames do not need print resolution
+        self.fig = plt.figure(figsize=self.figsize, dpi=100)
         self.ax_3d = self.fig.add_subplot(111, projection='3d')
         
         # Calculate penetration result
@@ -419,62 +496,68 @@ class Simple3DAnimator(Working3DRenderer):
         effective_thickness = armor.get_effective_thickness('kinetic', impact_angle)
         penetrates = penetration > effective_thickness
         
-        range_scaled = min(target_range / 100, 20)
+        range_scaled = _scaled_range(target_range)
         
         # Animation parameters
         fps = 20
         total_frames = int(duration * fps)
         
+        # Static scene, built once and kept across frames
+        self._setup_3d_environment()
+        self._render_simple_tank()
+        
+        # Phase artists are created up front and only updated or toggled per frame
+        projectile = self.ax_3d.scatter([], [], [], c='red', s=50, marker='o', alpha=0.8)
+        partial_trajectory, = self.ax_3d.plot([], [], [], 'r--', linewidth=2, alpha=0.6)
+        full_trajectory = self._new_artists(lambda: self._render_simple_trajectory(target_range))
+        impact_flash = self.ax_3d.scatter([range_scaled], [0], [0.5], c='orange', s=[0],
+                                          alpha=0.7, marker='o')
+        impact_analysis = self._new_artists(
+            lambda: self._render_impact_analysis(penetration, effective_thickness, target_range)
+        )
+        
+        # Approach-phase trajectory: the same cached curve, sliced per frame
+        x_full, y_full, z_full = _trajectory(range_scaled)
+        
+        # Slow camera rotation and a persistent frame counter
+        azimuths = 45 + 0.5 * np.arange(total_frames)
+        frame_title = self.ax_3d.text2D(0.5, 0.98, '', transform=self.ax_3d.transAxes,
+                                        ha='center', va='top', fontsize=12)
+        
         def animate_frame(frame):
-            self.ax_3d.clear()
-            self._setup_3d_environment()
-            self._render_simple_tank()
-            
             progress = frame / total_frames
+            approach = progress < 0.6
+            impact = 0.6 <= progress < 0.8
             
-            if progress < 0.6:  # Projectile approach phase
+            projectile.set_visible(approach)
+            partial_trajectory.set_visible(approach)
+            impact_flash.set_visible(impact)
+            for artist in full_trajectory:
+                artist.set_visible(not approach)
+            for artist in impact_analysis:
+                artist.set_visible(progress >= 0.8)
+            
+            if approach:  # Projectile approach phase
                 approach_progress = progress / 0.6
                 projectile_x = -5 + approach_progress * (range_scaled + 5)
-                projectile_z = 3 - 0.5 * approach_progress
-                
-                self.ax_3d.scatter([projectile_x], [0], [projectile_z],
-                                 c='red', s=50, marker='o', alpha=0.8)
+                projectile_z = np.interp(projectile_x, x_full, z_full)  # Ride the shared curve
+                projectile._offsets3d = ([projectile_x], [0], [projectile_z])
                 
                 # Show partial trajectory
                 traj_end = int(approach_progress * 50)
-                if traj_end > 0:
-                    x_points = np.linspace(-5, projectile_x, traj_end)
-                    z_points = 3 - 2.5 * ((x_points + 5) / (range_scaled + 5))**2
-                    y_points = np.zeros_like(x_points)
-                    
-                    self.ax_3d.plot(x_points, y_points, z_points, 
-                                   'r--', linewidth=2, alpha=0.6)
+                partial_trajectory.set_data_3d(x_full[:traj_end], y_full[:traj_end],
+                                               z_full[:traj_end])
             
-            elif progress < 0.8:  # Impact phase
+            elif impact:  # Impact phase
                 impact_progress = (progress - 0.6) / 0.2
                 
-                # Show full trajectory
-                self._render_simple_trajectory(target_range)
-                
                 # Show expanding impact effect
                 impact_size = impact_progress * 0.3
-                if impact_size > 0:
-                    self.ax_3d.scatter([range_scaled], [0], [0.5],
-                                     c='orange', s=impact_size*1000, 
-                                     alpha=0.7, marker='o')
-            
-            else:  # Post-impact effects
-                effects_progress = (progress - 0.8) / 0.2
-                
-                # Show full trajectory
-                self._render_simple_trajectory(target_range)
-                
-                # Show penetration analysis
-                self._render_impact_analysis(penetration, effective_thickness, target_range)
+                impact_flash.set_sizes([impact_size*1000])
             
             # Apply styling
-            self.ax_3d.set_title(f'Animated Penetration Analysis - Frame {frame+1}/{total_frames}')
-            self.ax_3d.view_init(elev=30, azim=45 + frame * 0.5)  # Slow rotation
+            frame_title.set_text(f'Animated Penetration Analysis - Frame {frame+1}/{total_frames}')
+            self.ax_3d.view_init(elev=30, azim=azimuths[frame])
         
         # Create animation
         anim = animation.FuncAnimation(self.fig, animate_frame, 
@@ -483,6 +566,13 @@ class Simple3DAnimator(Working3DRenderer):
                                      blit=False, repeat=True)
         
         return anim
+    
+    def _new_artists(self, render: Callable[[], Any]) -> List[Any]:
+        """Run a render method and return the artists it added to the 3D axis."""
+        
+        existing = set(self.ax_3d.get_children())
+        render()
+        return [artist for artist in self.ax_3d.get_children() if artist not in existing]
 
 
 # Export classes
@@ -11,11 +11,14 @@ This script demonstrates the complete 3D visualization system including:
 
 import sys
 import os
+import multiprocessing
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive until a test needs a window
 import matplotlib.pyplot as plt
 
 # Import our simulation components
@@ -64,12 +67,25 @@ def create_test_armor():
     
     return armor
 
+def _use_interactive_backend():
+    """Switch to TkAgg for an interactive window, staying on Agg when there is no display."""
+    
+    try:
+        plt.switch_backend('TkAgg')
+        return True
+    except ImportError as e:
+        print(f"⚠️  Interactive backend unavailable ({e}); staying on Agg")
+        return False
+
 def test_static_3d_visualization():
     """Test the static interactive 3D visualization."""
     
     print("Testing Static 3D Visualization...")
     print("=" * 50)
     
+    # Interactive window; switch before any figure exists since switching closes them
+    _use_interactive_backend()
+    
     # Create test objects
     ammunition = create_test_ammunition()
     armor = create_test_armor()
@@ -127,6 +143,9 @@ def test_animated_3d_visualization():
     print("\nTesting Animated 3D Visualization...")
     print("=" * 50)
     
+    # Interactive window; switch before any figure exists since switching closes them
+    _use_interactive_backend()
+    
     # Create test objects
     ammunition = create_test_ammunition()
     armor = create_test_armor()
@@ -170,40 +189,41 @@ def test_animated_3d_visualization():
         traceback.print_exc()
         return False
 
+def _render_one_style(style):
+    """Render and save one style in a worker process; returns a status line."""
+    
+    try:
+        renderer = Interactive3DRenderer(figsize=(10, 8), style=style)
+        
+        fig = renderer.create_complete_3d_visualization(
+            ammunition=create_test_ammunition(),
+            armor=create_test_armor(),
+            target_range=1500.0,
+            impact_angle=20.0,
+            launch_angle=3.0
+        )
+        
+        # Save each style
+        output_file = f"test_3d_{style}_style.png"
+        renderer.save_visualization(output_file, dpi=120)
+        plt.close(fig)
+        return f"✓ {style.capitalize()} style saved to: {output_file}"
+        
+    except Exception as e:
+        return f"❌ Error with {style} style: {e}"
+
 def test_different_styles():
     """Test different visualization styles."""
     
     print("\nTesting Different Visualization Styles...")
     print("=" * 50)
     
-    ammunition = create_test_ammunition()
-    armor = create_test_armor()
-    
     styles = ['professional', 'tactical', 'educational']
     
-    for style in styles:
-        print(f"\nTesting {style} style...")
-        
-        try:
-            renderer = Interactive3DRenderer(figsize=(10, 8), style=style)
-            
-            fig = renderer.create_complete_3d_visualization(
-                ammunition=ammunition,
-                armor=armor,
-                target_range=1500.0,
-                impact_angle=20.0,
-                launch_angle=3.0
-            )
-            
-            # Save each style
-            output_file = f"test_3d_{style}_style.png"
-            renderer.save_visualization(output_file, dpi=120)
-            print(f"✓ {style.capitalize()} style saved to: {output_file}")
-            
-            plt.close(fig)  # Close to avoid too many open figures
-            
-        except Exception as e:
-            print(f"❌ Error with {style} style: {e}")
+    # Styles are independent Agg renders, so run one per process
+    with multiprocessing.Pool(len(styles)) as pool:
+        for status in pool.map(_render_one_style, styles):
+            print(status)
 
 def run_integration_tests():
     """Run all integration tests."""
@@ -226,8 +246,7 @@ def run_integration_tests():
         print("❌ NumPy not available")
         return False
     
-    # Set matplotlib backend for testing
-    matplotlib.use('TkAgg')  # Use TkAgg backend for interactive display
+    # Styles test only saves PNGs on Agg; interactive tests switch to TkAgg themselves
     print(f"✓ Using matplotlib backend: {matplotlib.get_backend()}")
     
     # Run tests
@@ -11,6 +11,9 @@ import os
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Pick the backend before matplotlib loads; this test runs headless
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -127,7 +130,9 @@ def test_basic_3d_plot():
     print("=" * 40)
     
     try:
-        from mpl_toolkits.mplot3d import Axes3D
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+        from matplotlib.colors import to_rgba
+        from matplotlib.lines import Line2D
         
         # Create simple 3D plot
         fig = plt.figure(figsize=(10, 8))
@@ -137,31 +142,48 @@ def test_basic_3d_plot():
         x = np.array([0, 4, 4, 0, 0])  # Tank length
         y = np.array([-1, -1, 1, 1, -1])  # Tank width
         z = np.array([0, 0, 0, 0, 0])  # Ground level
-        
-        # Plot tank outline
-        ax.plot(x, y, z, 'b-', linewidth=3, label='Tank Hull')
+        hull = np.column_stack([x, y, z])
         
         # Add gun barrel
-        gun_x = [2, 6]
-        gun_y = [0, 0]
-        gun_z = [0.5, 0.5]
-        ax.plot(gun_x, gun_y, gun_z, 'k-', linewidth=4, label='Gun Barrel')
+        gun = np.array([[2, 0, 0.5], [6, 0, 0.5]])
         
         # Add projectile trajectory
         traj_x = np.linspace(-5, 2, 20)
-        traj_z = 2 - 0.1 * (traj_x + 5)**2 / 5  # Parabolic trajectory
+        # Parabolic trajectory, 2 - 0.1 * (x + 5)**2 / 5, built in one buffer
+        traj_z = np.empty_like(traj_x)
+        np.add(traj_x, 5, out=traj_z)
+        np.square(traj_z, out=traj_z)
+        traj_z *= -0.02
+        traj_z += 2
         traj_y = np.zeros_like(traj_x)
+        trajectory = np.column_stack([traj_x, traj_y, traj_z])
         
-        ax.plot(traj_x, traj_y, traj_z, 'r--', linewidth=2, alpha=0.7, label='Trajectory')
+        # Hull, gun and trajectory as one collection of (N, 2, 3) segments
+        lines = [  # polyline, color, linewidth, linestyle, label
+            (hull, to_rgba('b'), 3, '-', 'Tank Hull'),
+            (gun, to_rgba('k'), 4, '-', 'Gun Barrel'),
+            (trajectory, to_rgba('r', 0.7), 2, '--', 'Trajectory'),
+        ]
+        segments = [np.stack([pts[:-1], pts[1:]], axis=1) for pts, *_ in lines]
+        counts = [len(segs) for segs in segments]
+        ax.add_collection3d(Line3DCollection(
+            np.concatenate(segments),
+            colors=np.repeat([line[1] for line in lines], counts, axis=0),
+            linewidths=np.repeat([line[2] for line in lines], counts),
+            linestyles=[line[3] for line, n in zip(lines, counts) for _ in range(n)]))
+        
+        # Legend entries for the batched lines
+        handles = [Line2D([], [], color=color, linewidth=width, linestyle=style, label=label)
+                   for _, color, width, style, label in lines]
         
         # Add impact point
-        ax.scatter([2], [0], [0.2], c='red', s=100, marker='*', label='Impact')
+        handles.append(ax.scatter([2], [0], [0.2], c='red', s=100, marker='*', label='Impact'))
         
         # Styling
         ax.set_xlabel('Distance (m)')
         ax.set_ylabel('Lateral (m)')
         ax.set_zlabel('Height (m)')
-        ax.legend()
+        ax.legend(handles=handles)
         ax.set_title('Tank Armor Simulation - Basic 3D View')
         
         # Set equal aspect ratio
@@ -193,10 +215,7 @@ def run_simple_integration_test():
     try:
         import matplotlib
         print(f"✓ Matplotlib version: {matplotlib.__version__}")
-        
-        # Set backend for headless operation
-        matplotlib.use('Agg')  # Non-interactive backend
-        print("✓ Using non-interactive matplotlib backend (Agg)")
+        print(f"✓ Using matplotlib backend: {matplotlib.get_backend()}")
         
     except ImportError:
         print("❌ Matplotlib not available")
@@ -258,5 +277,7 @@ if __name__ == "__main__":
     if os.path.exists('test_basic_3d_plot.png'):
         print("  📄 test_basic_3d_plot.png")
     
-    print("\nPress any key to continue...")
-    input()
+    # Only hold the console open when explicitly asked to from a terminal
+    if sys.stdin.isatty() and '--interactive' in sys.argv:
+        print("\nPress any key to continue...")
+        input()
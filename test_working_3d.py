@@ -11,10 +11,18 @@ This script demonstrates the complete working 3D visualization system including:
 
 import sys
 import os
+import asyncio
+import functools
+import multiprocessing
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
 
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Pick the backend before matplotlib loads; static tests run on Agg
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -32,13 +40,10 @@ except ImportError as e:
     traceback.print_exc()
     sys.exit(1)
 
-def create_test_scenarios():
-    """Create different test scenarios for visualization."""
-    
-    scenarios = []
-    
-    # Scenario 1: Modern APFSDS vs Composite Armor (Penetration)
-    apfsds = APFSDS(
+@functools.lru_cache(maxsize=None)
+def _apfsds_m829a4():
+    """Shared M829A4 APFSDS round; tests only read it, so one instance suffices."""
+    return APFSDS(
         name="M829A4 APFSDS",
         caliber=120,
         penetrator_diameter=22,
@@ -46,14 +51,32 @@ def create_test_scenarios():
         muzzle_velocity=1670,
         penetrator_length=685
     )
-    
-    composite_armor = CompositeArmor(
+
+@functools.lru_cache(maxsize=None)
+def _modern_composite():
+    """Shared modern composite armor array."""
+    return CompositeArmor(
         name="Modern Composite",
         thickness=650,
         steel_layers=250,
         ceramic_layers=400,
         other_layers=0
     )
+
+@functools.lru_cache(maxsize=None)
+def _rha(thickness):
+    """Shared RHA plate of the given thickness in mm."""
+    return RHA(thickness=thickness)  # RHA constructor generates name automatically
+
+@functools.lru_cache(maxsize=None)
+def create_test_scenarios():
+    """Create different test scenarios for visualization (cached per process)."""
+    
+    scenarios = []
+    
+    # Scenario 1: Modern APFSDS vs Composite Armor (Penetration)
+    apfsds = _apfsds_m829a4()
+    composite_armor = _modern_composite()
     
     scenarios.append({
         'name': 'Modern APFSDS vs Composite',
@@ -72,9 +95,7 @@ def create_test_scenarios():
         muzzle_velocity=792
     )
     
-    steel_armor = RHA(
-        thickness=100  # RHA constructor generates name automatically
-    )
+    steel_armor = _rha(100)
     
     scenarios.append({
         'name': 'WWII AP vs Steel',
@@ -103,7 +124,70 @@ def create_test_scenarios():
         'style': 'educational'
     })
     
-    return scenarios
+    return tuple(scenarios)
+
+def batch_penetration(ammos, ranges, angles):
+    """
+    Penetration in mm RHA for paired ammunition, ranges (m) and impact angles.
+    
+    Uses a class-level calculate_penetration_batch when every round shares a
+    class that provides one, and falls back to per-round scalar calls.
+    """
+    ranges_km = np.asarray(ranges, dtype=float) / 1000
+    angles = np.asarray(angles, dtype=float)
+    
+    ammo_class = type(ammos[0])
+    batch = getattr(ammo_class, 'calculate_penetration_batch', None)
+    if batch is not None and all(type(ammo) is ammo_class for ammo in ammos):
+        return np.asarray(batch(ammos, ranges_km, angles), dtype=float)
+    
+    return np.array([ammo.calculate_penetration(r, a)
+                     for ammo, r, a in zip(ammos, ranges_km, angles)])
+
+# Per-process renderer, reset and restyled for each scenario a worker draws
+_scenario_renderer = None
+
+def _render_scenario(job):
+    """Render and save one scenario in a worker process; returns (ok, report lines)."""
+    
+    index, penetration, effective = job
+    
+    global _scenario_renderer
+    if _scenario_renderer is None:
+        _scenario_renderer = Working3DRenderer(figsize=(12, 9))
+    renderer = _scenario_renderer
+    
+    scenario = create_test_scenarios()[index]
+    lines = [f"\n📊 Scenario {index+1}: {scenario['name']}", "-" * 40]
+    
+    try:
+        renderer.reset(style=scenario['style'])
+        
+        # Create visualization
+        renderer.create_3d_visualization(
+            ammunition=scenario['ammo'],
+            armor=scenario['armor'],
+            target_range=scenario['range'],
+            impact_angle=scenario['angle']
+        )
+        
+        # Display results
+        result = "PENETRATION" if penetration > effective else "NO PENETRATION"
+        
+        lines.append(f"  🎯 Penetration: {penetration:.0f}mm RHA")
+        lines.append(f"  🛡️  Armor: {effective:.0f}mm RHA")
+        lines.append(f"  🎲 Result: {result}")
+        
+        # Save visualization
+        filename = f"test_3d_scenario_{index+1}_{scenario['style']}.png"
+        renderer.save_visualization(filename, dpi=150)
+        lines.append(f"  ✓ Saved: {filename}")
+        
+        return True, lines
+        
+    except Exception as e:
+        lines.append(f"  ❌ Error: {e}")
+        return False, lines
 
 def test_static_visualizations():
     """Test static 3D visualizations with different scenarios."""
@@ -114,42 +198,20 @@ def test_static_visualizations():
     scenarios = create_test_scenarios()
     results = []
     
-    for i, scenario in enumerate(scenarios):
-        print(f"\n📊 Scenario {i+1}: {scenario['name']}")
-        print("-" * 40)
-        
-        try:
-            # Create renderer
-            renderer = Working3DRenderer(figsize=(12, 9), style=scenario['style'])
-            
-            # Create visualization
-            fig = renderer.create_3d_visualization(
-                ammunition=scenario['ammo'],
-                armor=scenario['armor'],
-                target_range=scenario['range'],
-                impact_angle=scenario['angle']
-            )
-            
-            # Calculate and display results
-            penetration = scenario['ammo'].calculate_penetration(scenario['range']/1000, scenario['angle'])
-            effective = scenario['armor'].get_effective_thickness('kinetic', scenario['angle'])
-            result = "PENETRATION" if penetration > effective else "NO PENETRATION"
-            
-            print(f"  🎯 Penetration: {penetration:.0f}mm RHA")
-            print(f"  🛡️  Armor: {effective:.0f}mm RHA")
-            print(f"  🎲 Result: {result}")
-            
-            # Save visualization
-            filename = f"test_3d_scenario_{i+1}_{scenario['style']}.png"
-            renderer.save_visualization(filename, dpi=150)
-            print(f"  ✓ Saved: {filename}")
-            
-            plt.close(fig)  # Close to save memory
-            results.append(True)
-            
-        except Exception as e:
-            print(f"  ❌ Error: {e}")
-            results.append(False)
+    # Penetration for every scenario up front, in one batch where possible
+    penetrations = batch_penetration([s['ammo'] for s in scenarios],
+                                     [s['range'] for s in scenarios],
+                                     [s['angle'] for s in scenarios])
+    effectives = [s['armor'].get_effective_thickness('kinetic', s['angle']) for s in scenarios]
+    jobs = [(i, float(p), float(e)) for i, (p, e) in enumerate(zip(penetrations, effectives))]
+    
+    # Scenarios are independent Agg renders, so draw them in parallel processes.
+    # Spawned, not forked, since other test categories may be running on threads.
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1),
+                             mp_context=multiprocessing.get_context('spawn')) as executor:
+        for ok, lines in executor.map(_render_scenario, jobs):
+            print("\n".join(lines))
+            results.append(ok)
     
     return results
 
@@ -161,22 +223,8 @@ def test_animation():
     
     try:
         # Create test scenario
-        apfsds = APFSDS(
-            name="M829A4 APFSDS",
-            caliber=120,
-            penetrator_diameter=22,
-            penetrator_mass=7.0,
-            muzzle_velocity=1670,
-            penetrator_length=685
-        )
-        
-        armor = CompositeArmor(
-            name="Modern Composite",
-            thickness=650,
-            steel_layers=250,
-            ceramic_layers=400,
-            other_layers=0
-        )
+        apfsds = _apfsds_m829a4()
+        armor = _modern_composite()
         
         # Create animator
         animator = Simple3DAnimator(figsize=(10, 8), style='tactical')
@@ -194,14 +242,21 @@ def test_animation():
         # Save animation
         print("💾 Saving animation (this may take a moment)...")
         try:
-            # Use Pillow writer for GIF
-            from matplotlib.animation import PillowWriter
-            writer = PillowWriter(fps=20)
-            animation.save('test_penetration_animation.gif', writer=writer)
-            print("✓ Animation saved: test_penetration_animation.gif")
+            from matplotlib.animation import FFMpegWriter, PillowWriter
+            if FFMpegWriter.isAvailable():
+                # Multithreaded H.264 encode, much faster and smaller than GIF
+                filename = 'test_penetration_animation.mp4'
+                writer = FFMpegWriter(fps=20, codec='libx264', bitrate=2000,
+                                      extra_args=['-preset', 'ultrafast', '-pix_fmt', 'yuv420p'])
+            else:
+                # Fall back to Pillow writer for GIF
+                filename = 'test_penetration_animation.gif'
+                writer = PillowWriter(fps=20)
+            animation.save(filename, writer=writer)
+            print(f"✓ Animation saved: {filename}")
         except Exception as e:
             print(f"⚠️  Could not save animation: {e}")
-            print("  (This is often due to missing Pillow or imageio)")
+            print("  (This is often due to missing ffmpeg, Pillow or imageio)")
         
         plt.close()
         return True
@@ -227,16 +282,8 @@ def test_interactive_display():
             return True
         
         # Create simple scenario
-        apfsds = APFSDS(
-            name="Test APFSDS",
-            caliber=120,
-            penetrator_diameter=22,
-            penetrator_mass=7.0,
-            muzzle_velocity=1670,
-            penetrator_length=685
-        )
-        
-        armor = RHA(thickness=200)
+        apfsds = _apfsds_m829a4()
+        armor = _rha(200)
         
         # Create renderer
         renderer = Working3DRenderer(figsize=(10, 8), style='professional')
@@ -275,6 +322,31 @@ def test_interactive_display():
         print(f"❌ Interactive test error: {e}")
         return False
 
+def _run_display_test():
+    """Run test_interactive_display in a fresh process started on TkAgg."""
+    
+    child = subprocess.run([sys.executable, os.path.abspath(__file__), '--display-test'],
+                           env=dict(os.environ, MPLBACKEND='TkAgg'))
+    return child.returncode == 0
+
+def _call_test(test):
+    """Run one test category, returning its exception instead of raising."""
+    
+    try:
+        return test()
+    except Exception as e:
+        return e
+
+async def _run_categories(categories):
+    """
+    Run test categories concurrently on worker threads.
+    
+    Only test_animation drives pyplot in this process; the static renders and
+    the display test run in their own processes, so the threads never share
+    matplotlib state.
+    """
+    return await asyncio.gather(*(asyncio.to_thread(_call_test, test) for test in categories))
+
 def run_comprehensive_test():
     """Run all comprehensive tests."""
     
@@ -293,56 +365,52 @@ def run_comprehensive_test():
         print(f"❌ Missing dependency: {e}")
         return False
     
-    # Set matplotlib backend
-    matplotlib.use('Agg')  # Start with non-interactive backend
-    print("✓ Using Agg backend for static tests")
+    print(f"✓ Using {matplotlib.get_backend()} backend for static tests")
+    
+    # Run tests; categories overlap on threads unless --serial is given
+    print("\n" + "="*65)
+    categories = [test_static_visualizations, test_animation, _run_display_test]
+    if '--serial' in sys.argv:
+        outcomes = [_call_test(test) for test in categories]
+    else:
+        outcomes = asyncio.run(_run_categories(categories))
+    static_results, animation_result, display_result = outcomes
     
-    # Run tests
     test_results = {}
     
     # Test 1: Static visualizations
     print("\n" + "="*65)
-    try:
-        static_results = test_static_visualizations()
+    if isinstance(static_results, Exception):
+        print(f"❌ Static visualization tests: FAILED - {static_results}")
+        test_results['static'] = False
+    else:
         test_results['static'] = all(static_results)
         if test_results['static']:
             print("✅ Static visualization tests: PASSED")
         else:
             print(f"⚠️  Static visualization tests: {sum(static_results)}/{len(static_results)} passed")
-    except Exception as e:
-        print(f"❌ Static visualization tests: FAILED - {e}")
-        test_results['static'] = False
     
     # Test 2: Animation
-    print("\n" + "="*65)
-    try:
-        test_results['animation'] = test_animation()
+    if isinstance(animation_result, Exception):
+        print(f"❌ Animation test: FAILED - {animation_result}")
+        test_results['animation'] = False
+    else:
+        test_results['animation'] = animation_result
         if test_results['animation']:
             print("✅ Animation test: PASSED")
         else:
             print("❌ Animation test: FAILED")
-    except Exception as e:
-        print(f"❌ Animation test: FAILED - {e}")
-        test_results['animation'] = False
     
-    # Test 3: Interactive display (try to switch backend)
-    print("\n" + "="*65)
-    try:
-        # Try to use interactive backend
-        try:
-            matplotlib.use('TkAgg')
-            print("✓ Switched to TkAgg backend for interactive test")
-        except:
-            print("⚠️  Could not switch to interactive backend")
-        
-        test_results['interactive'] = test_interactive_display()
+    # Test 3: Interactive display
+    if isinstance(display_result, Exception):
+        print(f"❌ Interactive display test: FAILED - {display_result}")
+        test_results['interactive'] = False
+    else:
+        test_results['interactive'] = display_result
         if test_results['interactive']:
             print("✅ Interactive display test: PASSED")
         else:
             print("❌ Interactive display test: FAILED")
-    except Exception as e:
-        print(f"❌ Interactive display test: FAILED - {e}")
-        test_results['interactive'] = False
     
     # Summary
     print("\n" + "="*65)
@@ -370,21 +438,32 @@ def run_comprehensive_test():
     
     # List generated files
     print("\n📁 Generated Files:")
-    import glob
-    png_files = glob.glob("test_3d_*.png")
-    gif_files = glob.glob("test_*.gif")
+    png_files, animation_files = [], []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith('test_3d_') and name.endswith('.png'):
+                png_files.append(name)
+            elif name.startswith('test_') and name.endswith(('.gif', '.mp4')):
+                animation_files.append(name)
+    png_files.sort()
+    animation_files.sort()
     
     for png_file in png_files:
         print(f"   📄 {png_file}")
-    for gif_file in gif_files:
-        print(f"   🎬 {gif_file}")
+    for animation_file in animation_files:
+        print(f"   🎬 {animation_file}")
     
-    if not png_files and not gif_files:
+    if not png_files and not animation_files:
         print("   (No files generated - check for errors above)")
     
     return success
 
 if __name__ == "__main__":
+    if '--display-test' in sys.argv:
+        # Child run started by run_comprehensive_test for the TkAgg display test
+        sys.exit(0 if test_interactive_display() else 1)
+    
     success = run_comprehensive_test()
     
     if success:
@@ -398,4 +477,6 @@ if __name__ == "__main__":
     print("   renderer = Working3DRenderer(style='professional')")
     print("   fig = renderer.create_3d_visualization(ammo, armor, range, angle)")
     
-    input("\nPress Enter to exit...")
+    # Only hold the console open when explicitly asked to from a terminal
+    if sys.stdin.isatty() and '--interactive' in sys.argv:
+        input("\nPress Enter to exit...")
@@ -8,112 +8,243 @@ types fired at optimal angles, considering realistic physics and environmental f
 import sys
 import os
 import math
+from dataclasses import astuple
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+import numpy as np
+
+# Optional JIT compilation of the trajectory integrator
+try:
+    from numba import njit, prange
+except ImportError:
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from src.visualization.enhanced_3d_visualizer import Enhanced3DVisualizer
-from src.physics.advanced_physics import EnvironmentalConditions
+from src.physics.advanced_physics import AdvancedPhysicsEngine, EnvironmentalConditions
 from src.ammunition import APFSDS, HEAT, HESH
 from src.armor import CompositeArmor
 
-def calculate_maximum_range_for_ammo(ammo, launch_angle=45.0, max_time=120.0):
-    """Calculate maximum range for given ammunition at specified angle."""
-    
-    print(f"\nCalculating maximum range for: {ammo.name}")
-    print(f"Muzzle Velocity: {ammo.muzzle_velocity} m/s")
-    print(f"Mass: {ammo.mass} kg")
-    print(f"Launch Angle: {launch_angle}°")
-    
-    # Standard environmental conditions
-    env_conditions = EnvironmentalConditions(
-        temperature_celsius=15.0,
-        wind_speed_ms=0.0,  # No wind for maximum range
-        wind_angle_deg=0.0,
-        humidity_percent=50.0,
-        altitude_m=0.0
-    )
+# Standard environmental conditions, no wind for maximum range
+STANDARD_CONDITIONS = EnvironmentalConditions(
+    temperature_celsius=15.0,
+    wind_speed_ms=0.0,
+    wind_angle_deg=0.0,
+    humidity_percent=50.0,
+    altitude_m=0.0
+)
+
+# Integration time step in seconds (RK4)
+TIME_STEP = 0.01
+
+# Shared physics engine for air density and drag coefficients
+_PHYSICS = AdvancedPhysicsEngine()
+
+# Speeds at which the drag coefficient curve is sampled for the integrator
+CD_CURVE_V = np.linspace(0.0, 2500.0, 1024, dtype=np.float32)
+CD_CURVE_V.setflags(write=False)
+
+@lru_cache(maxsize=32)
+def build_cd_curve(physics_engine, penetration_type):
+    """Sample the engine's drag coefficient over CD_CURVE_V for one projectile type (cached)."""
+    cd_curve = np.array([physics_engine.calculate_drag_coefficient(float(v), penetration_type)
+                         for v in CD_CURVE_V], dtype=np.float32)
+    cd_curve.setflags(write=False)  # Shared between callers
+    return cd_curve
+
+@lru_cache(maxsize=32)
+def _cached_air_density(physics_engine, condition_fields):
+    """Air density keyed by a hashable tuple of EnvironmentalConditions fields."""
+    return physics_engine.calculate_air_density(EnvironmentalConditions(*condition_fields))
+
+def air_density_for(physics_engine, conditions):
+    """Air density for environmental conditions, cached by their field values."""
+    return _cached_air_density(physics_engine, astuple(conditions))
+
+@njit(fastmath=True, cache=True)
+def _drag_coefficient(speed, v_min, inv_dv, cd_curve_cd):
+    """
+    Linearly interpolate the drag curve, sampled on a uniform speed grid, at one speed.
     
-    # Create visualizer for trajectory calculation
-    visualizer = Enhanced3DVisualizer(debug_level="ERROR")  # Suppress debug output
+    Equivalent to np.interp on CD_CURVE_V, but plain index arithmetic, which
+    also keeps the per-stage cost low when Numba is not installed.
+    """
+    pos = (speed - v_min) * inv_dv
+    last = cd_curve_cd.shape[0] - 1
+    if pos <= 0.0:
+        return float(cd_curve_cd[0])
+    if pos >= last:
+        return float(cd_curve_cd[last])
+    i = int(pos)
+    lo = float(cd_curve_cd[i])
+    return lo + (pos - i) * (float(cd_curve_cd[i + 1]) - lo)
+
+@njit(fastmath=True, cache=True)
+def _acceleration(vx, vy, vz, k_drag, v_min, inv_dv, cd_curve_cd):
+    """Drag plus gravity acceleration for a velocity, with drag magnitude k_drag * cd * |v|^2."""
+    v_rel_mag = math.sqrt(vx*vx + vy*vy + vz*vz)
+    cd = _drag_coefficient(v_rel_mag, v_min, inv_dv, cd_curve_cd)
     
-    # Calculate trajectory with extended time limit
-    trajectory = []
+    # Drag deceleration per unit velocity, applied along -v
+    drag = k_drag * cd * v_rel_mag
+    return -drag * vx, -drag * vy, -drag * vz - 9.80665
+
+@njit(fastmath=True, cache=True)
+def _integrate(v0, angle_rad, mass, area, air_density, cd_curve_v, cd_curve_cd, max_time, dt):
+    """
+    RK4-integrate a drag-affected trajectory from gun height until ground impact.
     
-    # Initial conditions
-    dt = 0.001  # 1ms time step
-    angle_rad = math.radians(launch_angle)
+    The final step is interpolated back to z = 0.
     
-    # Initial velocity components
-    v0 = ammo.muzzle_velocity
+    Returns:
+        (x_final, t_final, v_final, traj) with float32 traj rows of
+        (time, x, y, z, velocity) sampled every 100ms
+    """
     vx = v0 * math.cos(angle_rad)
     vy = 0.0
     vz = v0 * math.sin(angle_rad)
     
-    # Initial position
     x, y, z = 0.0, 0.0, 2.4  # Start at gun height
     t = 0.0
     
-    # Environmental parameters
-    air_density = visualizer.physics_engine.calculate_air_density(env_conditions)
-    gravity = 9.80665
+    k_drag = 0.5 * air_density * area / mass
+    half_dt = 0.5 * dt
     
-    # Projectile parameters
-    mass = ammo.mass
-    cross_sectional_area = math.pi * (ammo.caliber / 2000.0) ** 2  # mm to m
+    # The drag curve speeds are evenly spaced
+    v_min = float(cd_curve_v[0])
+    inv_dv = (cd_curve_v.shape[0] - 1) / (float(cd_curve_v[-1]) - v_min)
     
-    # Integration loop for maximum range
-    while z >= 0 and t < max_time:
+    # Whole steps, so sampling is exact rather than derived from accumulated t
+    max_steps = int(round(max_time / dt))
+    sample_every = max(1, int(round(0.1 / dt)))
+    traj = np.empty((max_steps // sample_every + 1, 5), dtype=np.float32)
+    n_samples = 0
+    
+    for step in range(max_steps):
+        # Stop if velocity too low, compared squared to keep sqrt out of the step
+        if vx*vx + vy*vy + vz*vz < 100.0:  # 10 m/s minimum
+            break
+        
+        # Store trajectory point every 100ms
+        if step % sample_every == 0:
+            traj[n_samples, 0] = t
+            traj[n_samples, 1] = x
+            traj[n_samples, 2] = y
+            traj[n_samples, 3] = z
+            traj[n_samples, 4] = math.sqrt(vx*vx + vy*vy + vz*vz)
+            n_samples += 1
+        
+        # RK4 stages; position derivatives are the stage velocities
+        ax1, ay1, az1 = _acceleration(vx, vy, vz, k_drag, v_min, inv_dv, cd_curve_cd)
+        vx2, vy2, vz2 = vx + half_dt * ax1, vy + half_dt * ay1, vz + half_dt * az1
+        ax2, ay2, az2 = _acceleration(vx2, vy2, vz2, k_drag, v_min, inv_dv, cd_curve_cd)
+        vx3, vy3, vz3 = vx + half_dt * ax2, vy + half_dt * ay2, vz + half_dt * az2
+        ax3, ay3, az3 = _acceleration(vx3, vy3, vz3, k_drag, v_min, inv_dv, cd_curve_cd)
+        vx4, vy4, vz4 = vx + dt * ax3, vy + dt * ay3, vz + dt * az3
+        ax4, ay4, az4 = _acceleration(vx4, vy4, vz4, k_drag, v_min, inv_dv, cd_curve_cd)
         
-        # Current velocity magnitude
-        v_rel_mag = math.sqrt(vx**2 + vy**2 + vz**2)
+        x_next = x + dt / 6.0 * (vx + 2.0 * vx2 + 2.0 * vx3 + vx4)
+        y_next = y + dt / 6.0 * (vy + 2.0 * vy2 + 2.0 * vy3 + vy4)
+        z_next = z + dt / 6.0 * (vz + 2.0 * vz2 + 2.0 * vz3 + vz4)
+        vx_next = vx + dt / 6.0 * (ax1 + 2.0 * ax2 + 2.0 * ax3 + ax4)
+        vy_next = vy + dt / 6.0 * (ay1 + 2.0 * ay2 + 2.0 * ay3 + ay4)
+        vz_next = vz + dt / 6.0 * (az1 + 2.0 * az2 + 2.0 * az3 + az4)
         
-        # Stop if velocity too low
-        if v_rel_mag < 10.0:  # 10 m/s minimum
+        if z_next < 0:
+            # Ground impact inside this step: interpolate to z = 0
+            frac = z / (z - z_next)
+            x += frac * (x_next - x)
+            y += frac * (y_next - y)
+            vx += frac * (vx_next - vx)
+            vy += frac * (vy_next - vy)
+            vz += frac * (vz_next - vz)
+            z = 0.0
+            t += frac * dt
             break
         
-        # Calculate drag
-        cd = visualizer.physics_engine.calculate_drag_coefficient(v_rel_mag, ammo.penetration_type)
-        drag_force = 0.5 * air_density * v_rel_mag**2 * cd * cross_sectional_area
-        
-        # Drag acceleration components
-        if v_rel_mag > 0:
-            drag_ax = -drag_force * (vx / v_rel_mag) / mass
-            drag_ay = -drag_force * (vy / v_rel_mag) / mass
-            drag_az = -drag_force * (vz / v_rel_mag) / mass
-        else:
-            drag_ax = drag_ay = drag_az = 0
-        
-        # Total acceleration
-        ax = drag_ax
-        ay = drag_ay
-        az = drag_az - gravity
-        
-        # Store trajectory point every 100ms for efficiency
-        if int(t * 1000) % 100 == 0:
-            trajectory.append({
-                'time': t,
-                'x': x,
-                'y': y,
-                'z': z,
-                'velocity': v_rel_mag
-            })
-        
-        # Update velocity and position
-        vx += ax * dt
-        vy += ay * dt
-        vz += az * dt
-        
-        x += vx * dt
-        y += vy * dt
-        z += vz * dt
-        
-        t += dt
-    
-    # Results
-    max_range = x
-    flight_time = t
-    final_velocity = math.sqrt(vx**2 + vy**2 + vz**2) if trajectory else 0
+        x, y, z = x_next, y_next, z_next
+        vx, vy, vz = vx_next, vy_next, vz_next
+        t = (step + 1) * dt
+    
+    v_final = math.sqrt(vx*vx + vy*vy + vz*vz) if n_samples else 0.0
+    return x, t, v_final, traj[:n_samples]
+
+@njit(fastmath=True, cache=True, parallel=True)
+def _integrate_batch(v0, angle_rad, mass, area, type_idx, air_density, cd_curve_v, cd_tables,
+                     max_time, dt):
+    """
+    Integrate N independent trajectories given as per-trajectory arrays.
+    
+    Row type_idx[i] of cd_tables holds the drag curve for trajectory i.
+    
+    Returns:
+        (x_final, t_final, v_final) arrays of length N
+    """
+    n = v0.shape[0]
+    x_final = np.empty(n)
+    t_final = np.empty(n)
+    v_final = np.empty(n)
+    for i in prange(n):
+        x_final[i], t_final[i], v_final[i], _ = _integrate(
+            v0[i], angle_rad[i], mass[i], area[i], air_density,
+            cd_curve_v, cd_tables[type_idx[i]], max_time, dt)
+    return x_final, t_final, v_final
+
+def sweep_max_ranges(ammos, launch_angles, max_time=120.0, physics=_PHYSICS):
+    """
+    Integrate paired (ammunition, launch angle) trajectories in one batch.
+    
+    Args:
+        ammos: Ammunition for each trajectory
+        launch_angles: Launch angle in degrees for each trajectory
+        max_time: Flight time limit in seconds
+        physics: Physics engine supplying air density and drag coefficients
+        
+    Returns:
+        (max_range, flight_time, final_velocity) arrays, one entry per trajectory
+    """
+    air_density = air_density_for(physics, STANDARD_CONDITIONS)
+    
+    # One drag curve row per penetration type in the batch
+    types = list(dict.fromkeys(ammo.penetration_type for ammo in ammos))
+    cd_tables = np.array([build_cd_curve(physics, ptype) for ptype in types])
+    
+    v0 = np.array([ammo.muzzle_velocity for ammo in ammos], dtype=float)
+    angle_rad = np.radians(np.asarray(launch_angles, dtype=float))
+    mass = np.array([ammo.mass for ammo in ammos], dtype=float)
+    area = np.pi * (np.array([ammo.caliber for ammo in ammos], dtype=float) / 2000.0) ** 2  # mm to m
+    type_idx = np.array([types.index(ammo.penetration_type) for ammo in ammos], dtype=np.int64)
+    
+    return _integrate_batch(v0, angle_rad, mass, area, type_idx, air_density,
+                            CD_CURVE_V, cd_tables, max_time, TIME_STEP)
+
+def calculate_maximum_range_for_ammo(ammo, launch_angle=45.0, max_time=120.0, physics=_PHYSICS):
+    """Calculate maximum range for given ammunition at specified angle."""
+    
+    print(f"\nCalculating maximum range for: {ammo.name}")
+    print(f"Muzzle Velocity: {ammo.muzzle_velocity} m/s")
+    print(f"Mass: {ammo.mass} kg")
+    print(f"Launch Angle: {launch_angle}°")
+    
+    # Environmental parameters
+    air_density = air_density_for(physics, STANDARD_CONDITIONS)
+    
+    # Projectile parameters
+    cross_sectional_area = math.pi * (ammo.caliber / 2000.0) ** 2  # mm to m
+    cd_curve = build_cd_curve(physics, ammo.penetration_type)
+    
+    # Integrate to ground impact
+    max_range, flight_time, final_velocity, trajectory = _integrate(
+        float(ammo.muzzle_velocity), math.radians(launch_angle), float(ammo.mass),
+        cross_sectional_area, air_density, CD_CURVE_V, cd_curve, max_time, TIME_STEP)
     
     print(f"Maximum Range: {max_range:.0f} m ({max_range/1000:.2f} km)")
     print(f"Flight Time: {flight_time:.1f} s")
@@ -121,27 +252,100 @@ def calculate_maximum_range_for_ammo(ammo, launch_angle=45.0, max_time=120.0):
     
     return max_range, flight_time, trajectory
 
-def find_optimal_angle_for_ammo(ammo, angle_range=(30, 60), step=5):
-    """Find optimal launch angle for maximum range."""
+def refine_optimal_angles(ammos, low, high, max_time=60.0, tol=0.1):
+    """
+    Golden-section search for the range-maximizing angle of each ammunition type.
     
-    print(f"\nFinding optimal angle for: {ammo.name}")
+    All searches advance together, so each iteration is one batched sweep.
     
-    best_range = 0
-    best_angle = 45
-    results = []
+    Args:
+        ammos: Ammunition types to search
+        low: Lower angle bound in degrees for each ammunition type
+        high: Upper angle bound in degrees for each ammunition type
+        max_time: Flight time limit in seconds
+        tol: Width of the final angle bracket in degrees
+        
+    Returns:
+        (best_angle, best_range) arrays, one entry per ammunition type
+    """
+    inv_phi = (math.sqrt(5.0) - 1.0) / 2.0
+    low = np.array(low, dtype=float)
+    high = np.array(high, dtype=float)
+    
+    # Interior points c < d and their ranges
+    c = high - inv_phi * (high - low)
+    d = low + inv_phi * (high - low)
+    fc = sweep_max_ranges(ammos, c, max_time)[0]
+    fd = sweep_max_ranges(ammos, d, max_time)[0]
+    
+    while np.max(high - low) > tol:
+        # Keep the sub-bracket around the better interior point
+        left = fc > fd
+        high = np.where(left, d, high)
+        low = np.where(left, low, c)
+        
+        # The surviving interior point is reused; only one new point per search
+        new_c = high - inv_phi * (high - low)
+        new_d = low + inv_phi * (high - low)
+        f_new = sweep_max_ranges(ammos, np.where(left, new_c, new_d), max_time)[0]
+        c, d = np.where(left, new_c, d), np.where(left, c, new_d)
+        fc, fd = np.where(left, f_new, fd), np.where(left, fc, f_new)
+    
+    best_angle = np.where(fc > fd, c, d)
+    return best_angle, np.maximum(fc, fd)
+
+def find_optimal_angles(ammos, angle_range=(30, 60), step=5):
+    """
+    Find the optimal launch angle of each ammunition type.
+    
+    A batched coarse sweep over angle_range in step increments brackets the
+    optimum, which a golden-section search then refines to 0.1°.
+    """
+    
+    angles = list(range(angle_range[0], angle_range[1] + 1, step))
+    ranges, flight_times, _ = sweep_max_ranges(
+        [ammo for ammo in ammos for _ in angles], angles * len(ammos), max_time=60.0)
     
-    for angle in range(angle_range[0], angle_range[1] + 1, step):
-        max_range, flight_time, _ = calculate_maximum_range_for_ammo(ammo, angle, max_time=60.0)
-        results.append((angle, max_range, flight_time))
+    optimal = {}
+    for i, ammo in enumerate(ammos):
+        print(f"\nFinding optimal angle for: {ammo.name}")
         
-        if max_range > best_range:
-            best_range = max_range
-            best_angle = angle
+        best_range = 0
+        best_angle = 45
+        results = []
         
-        print(f"  {angle}°: {max_range:.0f}m ({flight_time:.1f}s)")
+        for j, angle in enumerate(angles):
+            max_range = ranges[i * len(angles) + j]
+            flight_time = flight_times[i * len(angles) + j]
+            results.append((angle, max_range, flight_time))
+            
+            if max_range > best_range:
+                best_range = max_range
+                best_angle = angle
+            
+            print(f"  {angle}°: {max_range:.0f}m ({flight_time:.1f}s)")
+        
+        optimal[ammo.name] = (best_angle, best_range, results)
+    
+    # Refine within one coarse step either side of each coarse optimum
+    coarse_best = [optimal[ammo.name][0] for ammo in ammos]
+    refined_angles, refined_ranges = refine_optimal_angles(
+        ammos,
+        [max(angle_range[0], angle - step) for angle in coarse_best],
+        [min(angle_range[1], angle + step) for angle in coarse_best])
     
-    print(f"\nOptimal angle: {best_angle}° with range: {best_range:.0f}m")
-    return best_angle, best_range, results
+    for ammo, best_angle, best_range in zip(ammos, refined_angles, refined_ranges):
+        _, coarse_range, results = optimal[ammo.name]
+        if best_range > coarse_range:
+            optimal[ammo.name] = (float(best_angle), best_range, results)
+        best_angle, best_range, _ = optimal[ammo.name]
+        print(f"\nOptimal angle for {ammo.name}: {best_angle:.1f}° with range: {best_range:.0f}m")
+    
+    return optimal
+
+def find_optimal_angle_for_ammo(ammo, angle_range=(30, 60), step=5):
+    """Find optimal launch angle for maximum range."""
+    return find_optimal_angles([ammo], angle_range, step)[ammo.name]
 
 def main():
     """Calculate maximum ranges for various ammunition types."""
@@ -178,25 +382,27 @@ def main():
     for ammo in ammunition_types:
         max_range, flight_time, trajectory = calculate_maximum_range_for_ammo(ammo, 45.0)
         max_ranges[ammo.name] = max_range
-        
-        # Find optimal angle for kinetic rounds (more relevant for long range)
-        if ammo.penetration_type == 'kinetic':
-            best_angle, best_range, _ = find_optimal_angle_for_ammo(ammo)
-            optimal_angles[ammo.name] = (best_angle, best_range)
+    
+    # Find optimal angles for kinetic rounds (more relevant for long range)
+    kinetic_rounds = [ammo for ammo in ammunition_types if ammo.penetration_type == 'kinetic']
+    for name, (best_angle, best_range, _) in find_optimal_angles(kinetic_rounds).items():
+        optimal_angles[name] = (best_angle, best_range)
     
     # Summary
     print("\n" + "=" * 60)
     print("SUMMARY - Maximum Ranges at 45°")
     print("=" * 60)
     
-    sorted_ranges = sorted(max_ranges.items(), key=lambda x: x[1], reverse=True)
+    # (ammo, range) rows, longest first
+    rows = [(ammo, max_ranges[ammo.name]) for ammo in ammunition_types]
+    rows.sort(key=itemgetter(1), reverse=True)
     
-    for name, range_m in sorted_ranges:
-        print(f"{name:15}: {range_m:6.0f}m ({range_m/1000:5.2f}km)")
+    for ammo, range_m in rows:
+        print(f"{ammo.name:15}: {range_m:6.0f}m ({range_m/1000:5.2f}km)")
     
     # Determine system maximum range
-    absolute_max_range = max(max_ranges.values())
-    fastest_ammo = max(ammunition_types, key=lambda a: a.muzzle_velocity)
+    absolute_max_range = rows[0][1]
+    fastest_ammo = max(ammunition_types, key=attrgetter('muzzle_velocity'))
     
     print(f"\nFastest Ammunition: {fastest_ammo.name} ({fastest_ammo.muzzle_velocity} m/s)")
     print(f"Absolute Maximum Range: {absolute_max_range:.0f}m ({absolute_max_range/1000:.2f}km)")
@@ -215,7 +421,7 @@ def main():
         
         for name, (angle, range_m) in optimal_angles.items():
             improvement = (range_m - max_ranges[name]) / max_ranges[name] * 100
-            print(f"{name:15}: {angle:2}° -> {range_m:6.0f}m (+{improvement:4.1f}%)")
+            print(f"{name:15}: {angle:4.1f}° -> {range_m:6.0f}m (+{improvement:4.1f}%)")
     
     return recommended_max, absolute_max_range, fastest_ammo
 
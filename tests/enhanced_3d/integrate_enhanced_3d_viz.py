@@ -6,6 +6,15 @@ by updating the penetration visualizer to use the new Enhanced3DVisualizer.
 """
 
 import os
+from pathlib import Path
+
+# Generated code snippets are kept as files beside this script
+SCRIPT_DIR = Path(__file__).resolve().parent
+TEMPLATE_DIR = SCRIPT_DIR / "templates"
+
+def read_template(name):
+    """Return the contents of a code template from the templates directory."""
+    return (TEMPLATE_DIR / name).read_text(encoding='utf-8')
 
 def update_penetration_visualizer():
     """Update the penetration visualizer to use the enhanced 3D system."""
@@ -18,89 +27,7 @@ def update_penetration_visualizer():
         return False
     
     # Create enhanced integration code
-    enhanced_integration = '''
-"""
-Enhanced Integration for PenetrationVisualizer
-
-This adds the Enhanced3DVisualizer to the existing penetration visualization system.
-"""
-
-def create_enhanced_3d_visualization(self, ammo, armor, target_range=2000.0, 
-                                   launch_angle=0.0, environmental_conditions=None):
-    """Create enhanced 3D visualization with accurate trajectory and interactive controls."""
-    
-    try:
-        from .enhanced_3d_visualizer import Enhanced3DVisualizer
-        from ..physics.advanced_physics import EnvironmentalConditions
-        
-        # Default environmental conditions if not provided
-        if environmental_conditions is None:
-            environmental_conditions = EnvironmentalConditions(
-                temperature_celsius=20.0,
-                wind_speed_ms=3.0,
-                wind_angle_deg=0.0,
-                humidity_percent=50.0
-            )
-        
-        # Create enhanced visualizer
-        visualizer = Enhanced3DVisualizer(figsize=(16, 12), debug_level="INFO")
-        
-        # Enable trajectory debug points for detailed analysis
-        visualizer.show_trajectory_debug = True
-        
-        # Create interactive 3D visualization
-        fig = visualizer.create_interactive_3d_visualization(
-            ammo, armor, target_range, launch_angle, environmental_conditions
-        )
-        
-        # Return both figure and visualizer for additional functionality
-        return fig, visualizer
-        
-    except ImportError as e:
-        print(f"Enhanced 3D visualization not available: {e}")
-        return None, None
-    except Exception as e:
-        print(f"Error creating enhanced 3D visualization: {e}")
-        return None, None
-
-def create_animated_3d_visualization(self, ammo, armor, target_range=2000.0,
-                                   launch_angle=0.0, duration=5.0, 
-                                   environmental_conditions=None):
-    """Create animated 3D visualization showing projectile following trajectory."""
-    
-    try:
-        from .enhanced_3d_visualizer import Enhanced3DVisualizer
-        from ..physics.advanced_physics import EnvironmentalConditions
-        
-        # Default environmental conditions if not provided
-        if environmental_conditions is None:
-            environmental_conditions = EnvironmentalConditions(
-                temperature_celsius=20.0,
-                wind_speed_ms=5.0,
-                wind_angle_deg=45.0,
-                humidity_percent=60.0
-            )
-        
-        # Create enhanced visualizer
-        visualizer = Enhanced3DVisualizer(figsize=(16, 12), debug_level="INFO")
-        
-        # Create visualization first
-        fig = visualizer.create_interactive_3d_visualization(
-            ammo, armor, target_range, launch_angle, environmental_conditions
-        )
-        
-        # Enable animation
-        animation = visualizer.enable_animation_mode(duration=duration)
-        
-        return fig, visualizer, animation
-        
-    except Exception as e:
-        print(f"Error creating animated 3D visualization: {e}")
-        return None, None, None
-
-# Add the methods to PenetrationVisualizer class
-# This should be added to the end of the PenetrationVisualizer class definition
-'''
+    enhanced_integration = read_template("enhanced_integration.txt")
     
     print("✓ Enhanced 3D visualization integration code prepared")
     print("\nTo integrate the enhanced 3D visualization system:")
@@ -113,116 +40,8 @@ def create_animated_3d_visualization(self, ammo, armor, target_range=2000.0,
 def create_gui_integration_example():
     """Create an example of how to integrate with the GUI."""
     
-    gui_integration_example = '''
-"""
-Example GUI Integration for Enhanced 3D Visualization
-
-Add this to your GUI button handler where you currently create 3D visualizations.
-"""
-
-def on_enhanced_3d_visualization_button_click(self):
-    """Handle enhanced 3D visualization button click."""
-    
-    # Get current ammunition and armor selections from GUI
-    ammo = self.get_selected_ammunition()
-    armor = self.get_selected_armor()
-    
-    if not ammo or not armor:
-        self.show_error_message("Please select both ammunition and armor.")
-        return
-    
-    # Get parameters from GUI inputs
-    target_range = float(self.range_entry.get() or 2000.0)
-    launch_angle = float(self.angle_entry.get() or 0.0)
-    
-    # Set up environmental conditions from GUI (if available)
-    from src.physics.advanced_physics import EnvironmentalConditions
-    env_conditions = EnvironmentalConditions(
-        temperature_celsius=float(self.temp_entry.get() or 20.0),
-        wind_speed_ms=float(self.wind_speed_entry.get() or 5.0),
-        wind_angle_deg=float(self.wind_angle_entry.get() or 0.0),
-        humidity_percent=float(self.humidity_entry.get() or 50.0),
-        altitude_m=float(self.altitude_entry.get() or 0.0)
-    )
-    
-    try:
-        # Create enhanced 3D visualization
-        from src.visualization.enhanced_3d_visualizer import Enhanced3DVisualizer
-        
-        visualizer = Enhanced3DVisualizer(figsize=(16, 12), debug_level="INFO")
-        visualizer.show_trajectory_debug = True  # Enable debug points
-        
-        # Create interactive visualization
-        fig, vis = visualizer.create_interactive_3d_visualization(
-            ammo, armor, target_range, launch_angle, env_conditions
-        )
-        
-        if fig:
-            # Show the interactive visualization
-            import matplotlib.pyplot as plt
-            plt.show()
-            
-            # Optionally save the visualization
-            save_path = f"enhanced_3d_viz_{ammo.name}_{armor.name}.png"
-            visualizer.save_visualization(save_path, dpi=300)
-            
-            self.show_info_message(f"Enhanced 3D visualization created and saved to {save_path}")
-        else:
-            self.show_error_message("Failed to create enhanced 3D visualization.")
-            
-    except Exception as e:
-        self.show_error_message(f"Error creating visualization: {str(e)}")
-
-def on_animated_3d_visualization_button_click(self):
-    """Handle animated 3D visualization button click."""
-    
-    # Get selections (same as above)
-    ammo = self.get_selected_ammunition()
-    armor = self.get_selected_armor()
-    
-    if not ammo or not armor:
-        self.show_error_message("Please select both ammunition and armor.")
-        return
-    
-    try:
-        from src.visualization.enhanced_3d_visualizer import Enhanced3DVisualizer
-        from src.physics.advanced_physics import EnvironmentalConditions
-        
-        # Environmental conditions
-        env_conditions = EnvironmentalConditions(
-            temperature_celsius=20.0,
-            wind_speed_ms=8.0,
-            wind_angle_deg=90.0,  # Crosswind for interesting effects
-            humidity_percent=70.0
-        )
-        
-        # Create visualizer
-        visualizer = Enhanced3DVisualizer(figsize=(18, 12), debug_level="INFO")
-        
-        # Create animated visualization
-        fig = visualizer.create_interactive_3d_visualization(
-            ammo, armor, target_range=2000.0, launch_angle=1.0, 
-            environmental_conditions=env_conditions
-        )
-        
-        # Enable animation
-        animation = visualizer.enable_animation_mode(duration=4.0)
-        
-        if fig and animation:
-            import matplotlib.pyplot as plt
-            plt.show()
-            
-            self.show_info_message("Animated 3D visualization created successfully!")
-        else:
-            self.show_error_message("Failed to create animated visualization.")
-            
-    except Exception as e:
-        self.show_error_message(f"Error creating animation: {str(e)}")
-
-# Add these buttons to your GUI layout:
-# - "Enhanced 3D Visualization" -> calls on_enhanced_3d_visualization_button_click
-# - "Animated 3D Visualization" -> calls on_animated_3d_visualization_button_click
-'''
+    # The example lives next to this script; write a copy to the working directory
+    gui_integration_example = SCRIPT_DIR.joinpath("gui_integration_example.py").read_text(encoding='utf-8')
     
     with open("gui_integration_example.py", "w", encoding='utf-8') as f:
         f.write(gui_integration_example)
@@ -233,72 +52,7 @@ def on_animated_3d_visualization_button_click(self):
 def create_simple_test_script():
     """Create a simple script to test the enhanced visualization directly."""
     
-    simple_test = '''
-"""
-Simple Test Script for Enhanced 3D Visualization
-
-Run this script to quickly test the enhanced 3D visualization system.
-"""
-
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
-
-from src.visualization.enhanced_3d_visualizer import Enhanced3DVisualizer
-from src.physics.advanced_physics import EnvironmentalConditions
-from src.ammunition import APFSDS
-from src.armor import CompositeArmor
-import matplotlib.pyplot as plt
-
-def run_simple_test():
-    """Run a simple test of the enhanced 3D visualization."""
-    
-    print("Testing Enhanced 3D Visualization System...")
-    
-    # Create test ammunition and armor
-    ammo = APFSDS(name="M829A4", caliber=120, penetrator_diameter=22, 
-                  penetrator_mass=8.5, muzzle_velocity=1680, penetrator_length=570)
-    
-    armor = CompositeArmor("Modern Tank Armor", thickness=600, 
-                          steel_layers=400, ceramic_layers=200)
-    
-    # Set up environmental conditions
-    env_conditions = EnvironmentalConditions(
-        temperature_celsius=25.0,
-        wind_speed_ms=7.0,
-        wind_angle_deg=30.0,
-        humidity_percent=65.0,
-        altitude_m=200.0
-    )
-    
-    # Create enhanced visualizer
-    visualizer = Enhanced3DVisualizer(figsize=(16, 12), debug_level="INFO")
-    visualizer.show_trajectory_debug = True
-    
-    # Create interactive 3D visualization
-    fig = visualizer.create_interactive_3d_visualization(
-        ammo, armor, target_range=2500.0, launch_angle=1.5,
-        environmental_conditions=env_conditions
-    )
-    
-    if fig:
-        print("✓ Enhanced 3D visualization created successfully!")
-        print("✓ Use mouse to rotate and zoom the 3D view")
-        print("✓ Trajectory follows accurate ballistic physics")
-        print("✓ Tank model has realistic proportions")
-        
-        # Save the visualization
-        visualizer.save_visualization("test_enhanced_3d.png", dpi=300)
-        print("✓ Static image saved as: test_enhanced_3d.png")
-        
-        # Show interactive visualization
-        plt.show()
-    else:
-        print("❌ Failed to create visualization")
-
-if __name__ == "__main__":
-    run_simple_test()
-'''
+    simple_test = read_template("simple_test.txt")
     
     with open("test_simple_enhanced_3d.py", "w", encoding='utf-8') as f:
         f.write(simple_test)
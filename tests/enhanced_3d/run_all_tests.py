@@ -2,25 +2,35 @@
 Master Test Runner for Enhanced 3D Visualization System
 
 This script runs all enhanced 3D visualization tests and organizes results properly.
+The scripts are run as __main__ in this interpreter; pass --isolated to run each
+one in its own subprocess instead (e.g. for memory-leak diagnostics).
 """
 
 import sys
 import os
+import functools
+import io
+import runpy
 import subprocess
+import tempfile
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 from datetime import datetime
 
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-def run_test_script(script_path, description):
-    """Run a test script and capture results."""
-    print(f"\n{'='*60}")
-    print(f"Running: {description}")
-    print(f"Script: {script_path}")
-    print(f"{'='*60}")
-    
+def run_test_script(script_path):
+    """
+    Run a test script in its own directory and capture its results.
+    
+    Returns:
+        (outcome, duration, stdout, stderr), outcome being one of
+        "passed", "failed", "timeout" or "error"
+    """
     start_time = time.time()
     
     try:
@@ -28,77 +38,128 @@ def run_test_script(script_path, description):
         test_dir = os.path.dirname(script_path)
         script_name = os.path.basename(script_path)
         
-        # Run the script
-        result = subprocess.run(
-            [sys.executable, script_name],
-            cwd=test_dir,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
-        
-        end_time = time.time()
-        duration = end_time - start_time
+        # Run the script with its output going to temporary files rather than
+        # pipes, so a chatty script never blocks on a full pipe
+        with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+            result = subprocess.run(
+                [sys.executable, script_name],
+                cwd=test_dir,
+                stdout=out,
+                stderr=err,
+                timeout=300  # 5 minute timeout
+            )
+            out.seek(0)
+            err.seek(0)
+            stdout = out.read().decode('utf-8', errors='replace')
+            stderr = err.read().decode('utf-8', errors='replace')
         
-        if result.returncode == 0:
-            print(f"✅ SUCCESS ({duration:.1f}s)")
-            if result.stdout:
-                print("Output:")
-                print(result.stdout)
-        else:
-            print(f"❌ FAILED ({duration:.1f}s)")
-            print("Error Output:")
-            print(result.stderr)
-            if result.stdout:
-                print("Standard Output:")
-                print(result.stdout)
-        
-        return result.returncode == 0, duration, result.stdout, result.stderr
+        duration = time.time() - start_time
+        outcome = "passed" if result.returncode == 0 else "failed"
+        return outcome, duration, stdout, stderr
         
     except subprocess.TimeoutExpired:
-        print(f"⏰ TIMEOUT after 5 minutes")
-        return False, 300, "", "Test timed out"
+        return "timeout", 300, "", "Test timed out"
     except Exception as e:
-        print(f"💥 EXCEPTION: {str(e)}")
-        return False, 0, "", str(e)
+        return "error", 0, "", str(e)
+
+def run_test_in_process(script_path):
+    """
+    Run a test script as __main__ in this interpreter and capture its results.
+    
+    As with a subprocess, the script fails by raising or exiting non-zero.
+    
+    Returns:
+        (outcome, duration, stdout, stderr), outcome being one of
+        "passed" or "failed"
+    """
+    start_time = time.time()
+    test_dir = os.path.dirname(os.path.abspath(script_path))
+    out, err = io.StringIO(), io.StringIO()
+    previous_dir = os.getcwd()
+    previous_argv = sys.argv
+    
+    # Scripts resolve their output paths relative to their own directory
+    if test_dir not in sys.path:
+        sys.path.insert(0, test_dir)
+    os.chdir(test_dir)
+    sys.argv = [os.path.basename(script_path)]
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            runpy.run_path(os.path.basename(script_path), run_name='__main__')
+        outcome = "passed"
+    except SystemExit as e:
+        outcome = "passed" if e.code in (None, 0) else "failed"
+    except Exception:
+        err.write(traceback.format_exc())
+        outcome = "failed"
+    finally:
+        sys.argv = previous_argv
+        os.chdir(previous_dir)
+        # Don't let one script's figures leak into the next
+        import matplotlib.pyplot as plt
+        plt.close('all')
+    
+    return outcome, time.time() - start_time, out.getvalue(), err.getvalue()
+
+def print_test_result(script_path, description, outcome, duration, stdout, stderr):
+    """Print the outcome of one test script."""
+    print(f"\n{'='*60}")
+    print(f"Running: {description}")
+    print(f"Script: {script_path}")
+    print(f"{'='*60}")
+    
+    if outcome == "timeout":
+        print(f"⏰ TIMEOUT after 5 minutes")
+    elif outcome == "error":
+        print(f"💥 EXCEPTION: {stderr}")
+    elif outcome == "passed":
+        print(f"✅ SUCCESS ({duration:.1f}s)")
+        if stdout:
+            print("Output:")
+            print(stdout)
+    else:
+        print(f"❌ FAILED ({duration:.1f}s)")
+        print("Error Output:")
+        print(stderr)
+        if stdout:
+            print("Standard Output:")
+            print(stdout)
 
 def create_test_report(test_results):
     """Create a detailed test report."""
     
     report_path = os.path.join("..", "..", "results", "enhanced_3d", "test_report.md")
     
-    with open(report_path, 'w', encoding='utf-8') as f:
-        f.write("# Enhanced 3D Visualization Test Report\n\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        # Summary
-        total_tests = len(test_results)
-        passed_tests = sum(1 for result in test_results if result[1])
-        failed_tests = total_tests - passed_tests
-        
-        f.write("## Summary\n\n")
-        f.write(f"- Total Tests: {total_tests}\n")
-        f.write(f"- Passed: {passed_tests} ✅\n")
-        f.write(f"- Failed: {failed_tests} ❌\n")
-        f.write(f"- Success Rate: {(passed_tests/total_tests)*100:.1f}%\n\n")
+    # Assemble the report in memory and write it in one go
+    parts = ["# Enhanced 3D Visualization Test Report\n\n",
+             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"]
+    
+    # Summary
+    total_tests = len(test_results)
+    passed_tests = sum(1 for result in test_results if result[1])
+    failed_tests = total_tests - passed_tests
+    
+    parts.append("## Summary\n\n"
+                 f"- Total Tests: {total_tests}\n"
+                 f"- Passed: {passed_tests} ✅\n"
+                 f"- Failed: {failed_tests} ❌\n"
+                 f"- Success Rate: {(passed_tests/total_tests)*100:.1f}%\n\n")
+    
+    # Detailed results
+    parts.append("## Detailed Results\n\n")
+    
+    for test_name, success, duration, stdout, stderr in test_results:
+        status = "✅ PASSED" if success else "❌ FAILED"
+        parts.append(f"### {test_name} - {status}\n\nDuration: {duration:.1f} seconds\n\n")
         
-        # Detailed results
-        f.write("## Detailed Results\n\n")
+        if stdout:
+            parts.extend(("**Output:**\n```\n", stdout, "\n```\n\n"))
         
-        for test_name, success, duration, stdout, stderr in test_results:
-            status = "✅ PASSED" if success else "❌ FAILED"
-            f.write(f"### {test_name} - {status}\n\n")
-            f.write(f"Duration: {duration:.1f} seconds\n\n")
-            
-            if stdout:
-                f.write("**Output:**\n```\n")
-                f.write(stdout)
-                f.write("\n```\n\n")
-            
-            if stderr:
-                f.write("**Error Output:**\n```\n")
-                f.write(stderr)
-                f.write("\n```\n\n")
+        if stderr:
+            parts.extend(("**Error Output:**\n```\n", stderr, "\n```\n\n"))
+    
+    with open(report_path, 'w', encoding='utf-8') as f:
+        f.write("".join(parts))
     
     print(f"\n📊 Test report saved to: {report_path}")
     return report_path
@@ -117,20 +178,36 @@ def main():
         ("test_comprehensive.py", "Comprehensive System Test"),
         ("integrate_enhanced_3d_viz.py", "Integration Script Test"),
     ]
+    isolated = '--isolated' in sys.argv
     
     test_results = []
     total_start_time = time.time()
     
-    # Run each test script
-    for script_name, description in test_scripts:
-        script_path = os.path.join(os.path.dirname(__file__), script_name)
-        
-        if os.path.exists(script_path):
-            success, duration, stdout, stderr = run_test_script(script_path, description)
-            test_results.append((description, success, duration, stdout, stderr))
-        else:
+    scripts = [(os.path.join(os.path.dirname(__file__), script_name), description)
+               for script_name, description in test_scripts]
+    
+    if isolated:
+        # The scripts are independent subprocesses, so run them concurrently;
+        # results are reported in the order listed above
+        executor = ThreadPoolExecutor(max_workers=min(len(scripts), os.cpu_count() or 1))
+        futures = [executor.submit(run_test_script, script_path) if os.path.exists(script_path) else None
+                   for script_path, _ in scripts]
+        executor.shutdown(wait=False)
+        runs = [future.result if future is not None else None for future in futures]
+    else:
+        # In-process runs share stdout and pyplot state, so they go one at a time
+        runs = [functools.partial(run_test_in_process, script_path) if os.path.exists(script_path) else None
+                for script_path, _ in scripts]
+    
+    for (script_path, description), run in zip(scripts, runs):
+        if run is None:
             print(f"❌ Script not found: {script_path}")
             test_results.append((description, False, 0, "", f"Script not found: {script_path}"))
+            continue
+        
+        outcome, duration, stdout, stderr = run()
+        print_test_result(script_path, description, outcome, duration, stdout, stderr)
+        test_results.append((description, outcome == "passed", duration, stdout, stderr))
     
     total_end_time = time.time()
     total_duration = total_end_time - total_start_time
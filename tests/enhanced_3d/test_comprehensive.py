@@ -11,10 +11,15 @@ This script tests:
 
 import sys
 import os
+from dataclasses import astuple
+from functools import lru_cache
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
+# Pick the backend before matplotlib loads; the tests only build figures headless
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
 import numpy as np
 import matplotlib.pyplot as plt
 from src.visualization.enhanced_3d_visualizer import (
@@ -26,13 +31,49 @@ from src.physics.advanced_physics import EnvironmentalConditions
 from src.ammunition import APFSDS
 from src.armor import CompositeArmor
 
+# M829A4 APFSDS keyword arguments, hashable for the trajectory cache
+M829A4_PARAMS = (("name", "M829A4"), ("caliber", 120), ("penetrator_diameter", 22),
+                 ("penetrator_mass", 8.5), ("muzzle_velocity", 1680), ("penetrator_length", 570))
+DM63_PARAMS = (("name", "DM63"), ("caliber", 120), ("penetrator_diameter", 24),
+               ("penetrator_mass", 8.2), ("muzzle_velocity", 1750), ("penetrator_length", 600))
+
+# Visualizer shared by the tests, created on first use
+_VISUALIZER = None
+
+def _get_visualizer():
+    """Return the shared visualizer without clearing its state."""
+    global _VISUALIZER
+    if _VISUALIZER is None:
+        _VISUALIZER = Enhanced3DVisualizer(debug_level="INFO")
+    return _VISUALIZER
+
+def _shared_visualizer(debug_level="INFO"):
+    """Return the shared visualizer reset for a new test, logging at debug_level."""
+    visualizer = _get_visualizer()
+    visualizer.reset()
+    visualizer.debug_logger.logger.setLevel(debug_level)
+    return visualizer
+
+@lru_cache(maxsize=None)
+def _apfsds(ammo_params):
+    """Shared APFSDS round for the given keyword arguments; the visualizer never mutates it."""
+    return APFSDS(**dict(ammo_params))
+
+@lru_cache(maxsize=None)
+def _cached_trajectory(ammo_params, target_range, launch_angle, condition_fields):
+    """APFSDS trajectory keyed by hashable ammunition and EnvironmentalConditions fields."""
+    ammo = _apfsds(ammo_params)
+    conditions = EnvironmentalConditions(*condition_fields)
+    return tuple(_get_visualizer().calculate_accurate_trajectory(
+        ammo, target_range=target_range, launch_angle=launch_angle,
+        environmental_conditions=conditions
+    ))
+
 def test_trajectory_calculation_accuracy():
     """Test trajectory calculation accuracy with debug logging."""
     print("=== Testing Trajectory Calculation Accuracy ===")
     
-    # Create test ammunition and environmental conditions
-    ammo = APFSDS(name="M829A4", caliber=120, penetrator_diameter=22, 
-                  penetrator_mass=8.5, muzzle_velocity=1680, penetrator_length=570)
+    # Create test environmental conditions
     conditions = EnvironmentalConditions(
         temperature_celsius=20.0,
         wind_speed_ms=5.0,
@@ -40,14 +81,11 @@ def test_trajectory_calculation_accuracy():
         humidity_percent=60.0
     )
     
-    # Create visualizer with debug logging
-    visualizer = Enhanced3DVisualizer(debug_level="DEBUG")
+    # Use the shared visualizer with debug logging
+    _shared_visualizer(debug_level="DEBUG")
     
     # Calculate trajectory
-    trajectory = visualizer.calculate_accurate_trajectory(
-        ammo, target_range=2000.0, launch_angle=0.0, 
-        environmental_conditions=conditions
-    )
+    trajectory = _cached_trajectory(M829A4_PARAMS, 2000.0, 0.0, astuple(conditions))
     
     # Verify trajectory properties
     assert len(trajectory) > 0, "Trajectory should have points"
@@ -74,7 +112,7 @@ def test_enhanced_tank_modeling():
     """Test enhanced tank model creation."""
     print("\n=== Testing Enhanced Tank Modeling ===")
     
-    visualizer = Enhanced3DVisualizer(debug_level="INFO")
+    visualizer = _shared_visualizer()
     tank_model = visualizer.create_enhanced_tank_model("modern_mbt")
     
     # Verify tank model components
@@ -109,13 +147,27 @@ def test_enhanced_tank_modeling():
     
     return tank_model
 
+def test_visualizer_reset_releases_previous_figure():
+    """Test that reset() closes the figure and clears per-visualization state."""
+    visualizer = Enhanced3DVisualizer(debug_level="ERROR")
+    visualizer.create_enhanced_tank_model("modern_mbt")
+    visualizer.fig = plt.figure()
+    visualizer.meta['armor'] = {'name': 'Test Armor'}
+    fig = visualizer.fig
+    
+    visualizer.reset()
+    
+    assert not plt.fignum_exists(fig.number), "Previous figure should be closed"
+    assert visualizer.fig is None and visualizer.ax is None
+    assert visualizer.tank_model == {} and visualizer.trajectory_points == []
+    assert visualizer.meta['armor'] is None
+
 def test_interactive_3d_visualization():
     """Test creation of interactive 3D visualization."""
     print("\n=== Testing Interactive 3D Visualization ===")
     
     # Create test objects
-    ammo = APFSDS(name="M829A4", caliber=120, penetrator_diameter=22, 
-                  penetrator_mass=8.5, muzzle_velocity=1680, penetrator_length=570)
+    ammo = _apfsds(M829A4_PARAMS)
     armor = CompositeArmor("M1A2 Frontal", thickness=650, steel_layers=400, ceramic_layers=250)
     
     # Environmental conditions with wind
@@ -127,8 +179,8 @@ def test_interactive_3d_visualization():
         altitude_m=500.0
     )
     
-    # Create visualizer
-    visualizer = Enhanced3DVisualizer(figsize=(16, 12), debug_level="INFO")
+    # Reuse the shared visualizer
+    visualizer = _shared_visualizer()
     
     # Create interactive 3D visualization
     fig = visualizer.create_interactive_3d_visualization(
@@ -165,12 +217,11 @@ def test_projectile_animation():
     print("\n=== Testing Projectile Animation ===")
     
     # Create test scenario
-    ammo = APFSDS(name="M829A4", caliber=120, penetrator_diameter=22, 
-                  penetrator_mass=8.5, muzzle_velocity=1680, penetrator_length=570)
+    ammo = _apfsds(M829A4_PARAMS)
     armor = CompositeArmor("T-80 Frontal", thickness=450, steel_layers=300, ceramic_layers=150)
     
-    # Create visualizer and visualization
-    visualizer = Enhanced3DVisualizer(debug_level="INFO")
+    # Create visualization on the shared visualizer
+    visualizer = _shared_visualizer()
     fig = visualizer.create_interactive_3d_visualization(
         ammo, armor, target_range=1500.0, launch_angle=0.5
     )
@@ -193,16 +244,12 @@ def test_penetration_analysis():
     print("\n=== Testing Penetration Analysis ===")
     
     # Test successful penetration scenario
-    powerful_ammo = APFSDS(name="DM63", caliber=120, penetrator_diameter=24, 
-                          penetrator_mass=8.2, muzzle_velocity=1750, penetrator_length=600)
+    powerful_ammo = _apfsds(DM63_PARAMS)
     weak_armor = CompositeArmor("Light Armor", thickness=200, steel_layers=200, ceramic_layers=0)
     
-    visualizer = Enhanced3DVisualizer(debug_level="INFO")
-    fig = visualizer.create_interactive_3d_visualization(
-        powerful_ammo, weak_armor, target_range=1000.0, launch_angle=0.0
-    )
-    
-    trajectory = visualizer.trajectory_points
+    # Only the impact point is checked, so skip building the 3D figure
+    visualizer = _shared_visualizer()
+    trajectory = _cached_trajectory(DM63_PARAMS, 1000.0, 0.0, astuple(EnvironmentalConditions()))
     impact_point = trajectory[-1]
     
     # Calculate expected penetration
@@ -224,9 +271,6 @@ def test_environmental_effects():
     """Test environmental effects on trajectory."""
     print("\n=== Testing Environmental Effects ===")
     
-    ammo = APFSDS(name="M829A4", caliber=120, penetrator_diameter=22, 
-                  penetrator_mass=8.5, muzzle_velocity=1680, penetrator_length=570)
-    
     # Test different environmental conditions
     test_conditions = [
         ("Standard", EnvironmentalConditions()),
@@ -238,13 +282,10 @@ def test_environmental_effects():
     ]
     
     results = {}
-    visualizer = Enhanced3DVisualizer(debug_level="INFO")
+    _shared_visualizer()
     
     for name, conditions in test_conditions:
-        trajectory = visualizer.calculate_accurate_trajectory(
-            ammo, target_range=2000.0, launch_angle=0.0,
-            environmental_conditions=conditions
-        )
+        trajectory = _cached_trajectory(M829A4_PARAMS, 2000.0, 0.0, astuple(conditions))
         
         if trajectory:
             final_point = trajectory[-1]
@@ -320,8 +361,7 @@ def create_demonstration_visualization():
     print("\n=== Creating Demonstration Visualization ===")
     
     # Create realistic combat scenario
-    ammo = APFSDS(name="M829A4", caliber=120, penetrator_diameter=22, 
-                  penetrator_mass=8.5, muzzle_velocity=1680, penetrator_length=570)
+    ammo = _apfsds(M829A4_PARAMS)
     armor = CompositeArmor("T-90M Frontal", thickness=550, steel_layers=350, ceramic_layers=200)
     
     # Realistic environmental conditions
@@ -367,7 +407,7 @@ if __name__ == "__main__":
         
         print("\nTo view the interactive demonstration:")
         print("1. The static image has been saved")
-        print("2. Run this script interactively to see the 3D visualization")
+        print("2. Run this script with MPLBACKEND=TkAgg to see the 3D visualization")
         print("3. Use mouse controls to rotate and zoom the view")
         
         # Show interactive visualization if running in interactive mode
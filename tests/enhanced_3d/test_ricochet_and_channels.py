@@ -186,3 +186,53 @@ def test_create_from_dataset_renders_channel_segments_and_exit_marker():
     # Expect at least +2 lines for 2 channel segments
     assert chan_lines >= base_lines + 2, "Channel segments should add lines to the plot"
 
+
+def test_hidden_channel_overlay_draws_nothing_visible_until_enabled():
+    data = _base_dataset()
+    data['impact_analysis'] = {
+        'penetrates': True,
+        'penetration_mm': 400.0,
+        'impact_position_m': {'x': 5.0, 'y': 0.0, 'z': 1.0},
+        'channel_segments': [
+            {'part': 'hull', 'start': {'x': 5.0, 'y': 0.0, 'z': 1.0}, 'end': {'x': 5.1, 'y': 0.0, 'z': 0.9}, 'partial': False}
+        ],
+        'overpenetration': True
+    }
+    viz = Enhanced3DVisualizer(figsize=(6, 4), debug_level="ERROR")
+    viz.show_channel_segments = False
+    viz.create_from_dataset(data)
+
+    def visible_lines(color):
+        return [ln for ln in viz.ax.lines if ln.get_visible() and ln.get_color() == color]
+
+    # Hidden channels show neither the chain, a single-channel fallback, nor the spall cone
+    assert visible_lines('red') == []
+    assert visible_lines('orange') == []
+
+    viz.set_overlay_visibility(channels=True)
+    assert len(visible_lines('red')) == 1
+    assert len(visible_lines('orange')) > 0
+
+
+def test_legend_lists_only_visible_overlays():
+    data = _base_dataset()
+    data['impact_analysis'] = {
+        'penetrates': False,
+        'impact_position_m': {'x': 5.0, 'y': 0.0, 'z': 1.0},
+        'ricochet': True,
+        'ricochet_outcome': 'ricochet',
+        'ricochet_point': {'x': 5.0, 'y': 0.0, 'z': 1.0},
+        'ricochet_direction': {'x': 1.0, 'y': 0.0, 'z': 0.0}
+    }
+    viz = Enhanced3DVisualizer(figsize=(6, 4), debug_level="ERROR")
+    viz.show_ricochet_overlay = False
+    viz.create_from_dataset(data)
+    viz._update_legend()
+
+    def legend_labels():
+        return [text.get_text() for text in viz.ax.get_legend().get_texts()]
+
+    assert 'Ricochet' not in legend_labels()
+
+    viz.set_overlay_visibility(ricochet=True)
+    assert 'Ricochet' in legend_labels()
@@ -0,0 +1,80 @@
+"""
+Tests for the interactive 3D model and trajectory builders.
+"""
+import numpy as np
+
+from src.visualization.interactive_3d import Interactive3DVisualizer, Environmental3DEffects
+from src.ammunition import APFSDS, HEAT
+
+
+def _make_ammo():
+    apfsds = APFSDS(name="Test APFSDS", caliber=120, penetrator_diameter=22,
+                    penetrator_mass=4.6, muzzle_velocity=1680, penetrator_length=570)
+    heat = HEAT("Test HEAT", 120.0, 18.6, 2.4, 150)
+    return apfsds, heat
+
+
+def test_batched_trajectories_match_single_shots():
+    apfsds, heat = _make_ammo()
+    env = {'wind_speed': 5.0, 'wind_direction': 45.0}
+    viz = Interactive3DVisualizer()
+
+    shots = [(apfsds, 2.0), (apfsds, 0.0), (heat, 2.0), (heat, 0.0)]
+    batch = viz.create_3d_trajectories([a for a, _ in shots], 2000.0,
+                                       [angle for _, angle in shots], env)
+
+    assert len(batch) == len(shots)
+    for (ammo, angle), batched in zip(shots, batch):
+        single = viz.create_3d_trajectory(ammo, 2000.0, angle, env)
+        assert single['positions'].shape == batched['positions'].shape
+        assert np.allclose(single['positions'][-1], batched['positions'][-1])
+        assert np.isclose(single['environmental_effects']['flight_time'],
+                          batched['environmental_effects']['flight_time'])
+
+
+def test_trajectory_terminates_and_loses_speed():
+    apfsds, _ = _make_ammo()
+    result = Interactive3DVisualizer().create_3d_trajectory(apfsds, 2000.0, 0.0)
+
+    effects = result['environmental_effects']
+    assert len(result['positions']) > 0, "Trajectory should contain points"
+    assert len(result['speeds']) == len(result['times']) == len(result['positions'])
+    assert 0 < effects['impact_velocity'] < apfsds.muzzle_velocity
+    assert effects['drag_losses'] > 0
+    # Flat shot from gun height grounds short of the range cap, exactly at z = 0
+    assert result['positions'][-1, 2] == 0.0
+    assert result['times'][-2] < effects['flight_time'] <= result['times'][-2] + 0.05
+
+
+def test_tank_model_is_cached_and_read_only():
+    first = Interactive3DVisualizer().create_3d_tank_model('modern_mbt')
+    second = Interactive3DVisualizer().create_3d_tank_model('modern_mbt')
+
+    assert first is second
+    assert not first['hull']['vertices'].flags.writeable
+    assert not first['tracks']['left']['vertices'].flags.writeable
+
+
+def test_behind_armor_effects_are_deterministic_and_cached():
+    viz = Interactive3DVisualizer()
+    first = viz._create_behind_armor_effects_3d([10.0, 0.0, 1.5], 'kinetic', 500)
+    again = viz._create_behind_armor_effects_3d([10.0, 0.0, 1.5], 'kinetic', 500)
+    fresh = Interactive3DVisualizer()._create_behind_armor_effects_3d([10.0, 0.0, 1.5], 'kinetic', 500)
+
+    assert first is again
+    assert np.array_equal(first['fragments'], fresh['fragments'])
+    assert first['fragments'].shape == (10, 3)
+
+
+def test_wind_field_layout_is_consistent_across_grid_sizes():
+    effects = Environmental3DEffects()
+    for grid_shape in [(8, 6, 4), (30, 20, 20)]:
+        wind = effects.create_wind_visualization(5.0, 90.0, grid_shape=grid_shape)
+        n_points = int(np.prod(grid_shape))
+
+        assert wind['positions'].shape == wind['vectors'].shape == (n_points, 3)
+        # x varies slowest and z fastest, matching meshgrid(..., indexing='ij')
+        assert wind['positions'][0, 0] == -10.0 and wind['positions'][-1, 0] == 10.0
+        assert wind['positions'][1, 2] > wind['positions'][0, 2]
+        assert np.all(np.abs(wind['vectors'][:, 1] - 5.0) <= 0.1)
+        assert np.all(wind['vectors'][:, 2] == 0.0)
@@ -561,6 +561,38 @@ def test_integration_with_simulation():
         return False
 
 
+def test_json_encoding_prefers_orjson_when_installed():
+    """Session JSON is encoded with orjson when available and handles NumPy values."""
+    import numpy as np
+    import logging_system
+
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+    assert logging_system._HAS_ORJSON == (orjson is not None)
+
+    data = {"penetration": np.float32(512.5), "samples": np.arange(3), 1: "non-str key"}
+    decoded = json.loads(logging_system._dumps(data))
+    assert decoded == {"penetration": 512.5, "samples": [0, 1, 2], "1": "non-str key"}
+
+    # Objects the encoder cannot handle go through the caller's serializer
+    assert json.loads(logging_system._dumps({"obj": object()}, default=lambda o: "custom")) == {"obj": "custom"}
+
+
+def test_json_logs_are_written_as_utf8(tmp_path):
+    """Non-ASCII text in the JSON logs is stored as UTF-8 whatever the locale encoding."""
+    logger = SimulationLogger(log_dir=str(tmp_path), log_level="ERROR")
+    logger.log_advanced_physics_details("Obliquity 30°", {"angle": "30°"}, {"note": "Δv ≈ 12 m/s"})
+    logger.finalize_session()
+
+    physics_file = next(tmp_path.glob("advanced_physics_*.json"))
+    physics = json.loads(physics_file.read_bytes().decode('utf-8'))
+    assert physics["physics_calculations"][0]["input_parameters"] == {"angle": "30°"}
+    assert physics["physics_calculations"][0]["physics_calculations"] == {"note": "Δv ≈ 12 m/s"}
+    session = json.loads(next(tmp_path.glob("session_*.json")).read_bytes().decode('utf-8'))
+    assert session["session_id"] == logger.session_id
+
 if __name__ == "__main__":
     # Run comprehensive logging tests
     tester = TestLoggingSystem()
@@ -0,0 +1,41 @@
+"""
+Tests for the interactive 3D renderer.
+"""
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from src.visualization.renderer_3d import Interactive3DRenderer
+from src.ammunition import APFSDS
+from src.armor import CompositeArmor
+
+
+def test_styles_render_into_one_shared_figure(tmp_path):
+    ammo = APFSDS(name="Test APFSDS", caliber=120, penetrator_diameter=22,
+                  penetrator_mass=7.0, muzzle_velocity=1670, penetrator_length=685)
+    armor = CompositeArmor("Test Composite", 650.0, 250.0, 400.0)
+
+    fig = plt.figure(figsize=(6, 5))
+    open_figures = plt.get_fignums()
+    try:
+        draw_callbacks = []
+        for style in ('professional', 'tactical'):
+            renderer = Interactive3DRenderer(figsize=(6, 5), style=style, fig=fig)
+            assert renderer.create_complete_3d_visualization(
+                ammunition=ammo, armor=armor, target_range=1500.0,
+                impact_angle=20.0, launch_angle=3.0) is fig
+
+            # Saving draws the canvas; the previous style's widgets must not redraw into it
+            output = tmp_path / f"{style}.png"
+            renderer.save_visualization(str(output), dpi=40)
+            assert output.stat().st_size > 0
+            draw_callbacks.append(len(fig.canvas.callbacks.callbacks.get('draw_event', {})))
+
+        # Both styles drew into the given figure instead of opening new ones
+        assert plt.get_fignums() == open_figures
+        assert draw_callbacks[0] == draw_callbacks[1]
+        # The reused figure carries the last style's colors
+        assert matplotlib.colors.same_color(fig.get_facecolor(),
+                                            renderer.color_schemes['tactical']['background'])
+    finally:
+        plt.close(fig)
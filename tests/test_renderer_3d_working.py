@@ -0,0 +1,73 @@
+"""
+Tests for the working 3D renderer helpers.
+"""
+import numpy as np
+
+from src.visualization.renderer_3d_working import Working3DRenderer
+from src.ammunition import APFSDS, AP, HEAT
+from src.armor import RHA, CompositeArmor
+
+
+def test_penetration_sweep_matches_scalar_calculations():
+    renderer = Working3DRenderer()
+    apfsds = APFSDS(name="Test APFSDS", caliber=120, penetrator_diameter=22,
+                    penetrator_mass=4.6, muzzle_velocity=1680, penetrator_length=570)
+    ap = AP("Test AP", 76, 7.0, 792)
+    heat = HEAT("Test HEAT", 120, 18.6, 7.4, 150)
+    armors = [RHA(200.0), CompositeArmor("Test Composite", 650.0, 200.0, 350.0, 100.0)]
+
+    ranges = np.array([500.0, 2000.0, 4000.0])
+    angles = np.array([[0.0], [30.0], [60.0]])
+    for ammo in (apfsds, ap, heat):
+        for armor in armors:
+            penetration, effective = renderer.calculate_penetration_sweep(ammo, armor, ranges, angles)
+            assert penetration.shape == effective.shape == (3, 3)
+            for i, angle in enumerate(angles[:, 0]):
+                for j, target_range in enumerate(ranges):
+                    assert np.isclose(penetration[i, j],
+                                      ammo.calculate_penetration(target_range / 1000, angle))
+                    assert np.isclose(effective[i, j],
+                                      armor.get_effective_thickness(ammo.penetration_type, angle))
+
+
+def test_penetration_sweep_respects_overrides():
+    class HeavyAPFSDS(APFSDS):
+        def calculate_penetration(self, range_m, impact_angle):
+            return 2 * super().calculate_penetration(range_m, impact_angle)
+
+    class SteepArmor(RHA):
+        def get_effective_thickness(self, ammo_type, impact_angle):
+            return self.thickness * (1.0 + impact_angle / 10.0)
+
+    renderer = Working3DRenderer()
+    ammo = HeavyAPFSDS(name="Heavy APFSDS", caliber=120, penetrator_diameter=22,
+                       penetrator_mass=4.6, muzzle_velocity=1680, penetrator_length=570)
+    armor = SteepArmor(200.0)
+
+    ranges = np.array([500.0, 2000.0])
+    angles = np.array([0.0, 45.0])
+    penetration, effective = renderer.calculate_penetration_sweep(ammo, armor, ranges, angles)
+    for k in range(2):
+        assert np.isclose(penetration[k], ammo.calculate_penetration(ranges[k] / 1000, angles[k]))
+        assert np.isclose(effective[k], armor.get_effective_thickness('kinetic', angles[k]))
+
+
+def test_reset_redraws_into_the_same_figure():
+    import matplotlib.pyplot as plt
+
+    renderer = Working3DRenderer(figsize=(6, 5))
+    ap = AP("Test AP", 76, 7.0, 792)
+    armor = RHA(100.0)
+
+    fig = renderer.create_3d_visualization(ap, armor, 1000.0, 30.0)
+    try:
+        renderer.reset(style='tactical')
+        assert renderer.create_3d_visualization(ap, armor, 1000.0, 30.0) is fig
+        assert len(fig.axes) == 1
+        assert renderer.colors['background'] == '#2C3E50'
+        # Without a reset each call still gets its own figure
+        other = renderer.create_3d_visualization(ap, armor, 1000.0, 30.0)
+        assert other is not fig
+        plt.close(other)
+    finally:
+        plt.close(fig)
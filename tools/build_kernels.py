@@ -0,0 +1,42 @@
+"""
+Ahead-of-time build of the serial 3D visualization kernels.
+
+Compiles ring, channel and apfsds_penetration from
+src/visualization/numba_kernels.py into a native tank_kernels extension next
+to that module, so test runs and first renders import machine code instead
+of paying Numba's JIT warm-up:
+
+    python tools/build_kernels.py
+
+numba_kernels uses the extension when it is present and falls back to its
+JIT-compiled versions otherwise. wind_field is parallel, which Numba's AOT
+compiler does not support, so it stays JIT-only.
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Compile from the JIT sources, not a previously built extension
+sys.modules['src.visualization.tank_kernels'] = None
+
+from src.visualization import numba_kernels  # noqa: E402
+
+cc = CC('tank_kernels')
+cc.output_dir = os.path.join(ROOT, 'src', 'visualization')
+cc.verbose = True
+
+# Signatures match how interactive_3d and renderer_3d_working call the kernels
+cc.export('ring', 'f4[:, :](f8[:], f8, f8[:], f8[:])')(numba_kernels.ring.py_func)
+cc.export('channel', 'f4[:, :, :](f8[:], f8, f8, f8, f8, f8[:], f8[:])')(
+    numba_kernels.channel.py_func)
+cc.export('apfsds_penetration', 'f8[:](f8[:], f8[:], f8, f8, f8)')(
+    numba_kernels.apfsds_penetration.py_func)
+
+
+if __name__ == '__main__':
+    cc.compile()